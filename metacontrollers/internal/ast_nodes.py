@@ -0,0 +1,61 @@
+import ast
+from typing import Dict
+
+from metacontrollers.internal.namespace import (
+    ACTION_RESULT_ASSIGNMENT_NAME,
+    CHOSEN_ARG_NAME,
+    CLASS_ARG_NAME,
+    K_ARG_NAME,
+    NO_CHOSEN_NAME,
+    PARTITION_ARG_NAME,
+)
+
+# expression contexts carry no state, so a single instance of each can be shared
+LOAD = ast.Load()
+STORE = ast.Store()
+
+_NAME_LOAD_CACHE: Dict[str, ast.Name] = {}
+_ARG_CACHE: Dict[str, ast.arg] = {}
+
+
+def load_name(id: str) -> ast.Name:
+    """
+    Returns a shared ast.Name node that loads the given identifier. Generated call
+    methods are only ever consumed by compile(), so leaf nodes in a Load context can
+    safely be reused between (and within) syntax trees.
+
+    Args:
+        id (str): identifier to load
+
+    Returns:
+        ast.Name: cached ast.Name node with a Load context
+    """
+    node = _NAME_LOAD_CACHE.get(id)
+    if node is None:
+        node = _NAME_LOAD_CACHE[id] = ast.Name(id=id, ctx=LOAD)
+    return node
+
+
+def arg_node(arg: str) -> ast.arg:
+    """
+    Returns a shared, unannotated ast.arg node for use in generated signatures.
+
+    Args:
+        arg (str): name of the argument
+
+    Returns:
+        ast.arg: cached ast.arg node
+    """
+    node = _ARG_CACHE.get(arg)
+    if node is None:
+        node = _ARG_CACHE[arg] = ast.arg(arg=arg, annotation=None)
+    return node
+
+
+# loads of the names every generated call method refers to
+CLASS_ARG_LOAD = load_name(CLASS_ARG_NAME)
+PARTITION_ARG_LOAD = load_name(PARTITION_ARG_NAME)
+K_ARG_LOAD = load_name(K_ARG_NAME)
+CHOSEN_ARG_LOAD = load_name(CHOSEN_ARG_NAME)
+NO_CHOSEN_LOAD = load_name(NO_CHOSEN_NAME)
+ACTION_RESULT_LOAD = load_name(ACTION_RESULT_ASSIGNMENT_NAME)
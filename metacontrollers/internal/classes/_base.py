@@ -1,16 +1,29 @@
 import ast
+import builtins
 from abc import ABC, abstractmethod
 from textwrap import dedent
+from types import CodeType, FunctionType
 from typing import Any, Callable, Dict, List, Tuple, Union
 
+from metacontrollers.internal.ast_nodes import (
+    CHOSEN_ARG_LOAD,
+    CLASS_ARG_LOAD,
+    LOAD,
+    STORE,
+    arg_node,
+    load_name,
+)
 from metacontrollers.internal.exceptions import (
     ArgumentError,
     InvalidControllerMethodError,
 )
 from metacontrollers.internal.method_inspector import MethodInspector
+from metacontrollers.internal.method_invocation import MethodInvocation
 from metacontrollers.internal.namespace import (
     ACTION_METHOD_NAME,
+    CHOSEN_ARG_NAME,
     CLASS_ARG_NAME,
+    FILTER_LOCAL_NAME,
     FILTER_METHOD_NAME,
     FOLD_METHOD_NAME,
     GENERATED_CALL_METHOD_NAME,
@@ -22,6 +35,27 @@ from metacontrollers.internal.namespace import (
     SORT_KEY_METHOD_NAME,
 )
 
+# call method key -> (code of the call function, globals the call function runs with)
+_CALL_METHOD_CODE_CACHE: Dict[tuple, Tuple[CodeType, dict]] = {}
+
+
+def _get_method_key(method: Union[MethodInspector, None]) -> Union[tuple, None]:
+    """
+    Describes the parts of a controlled method's signature that change the generated
+    call method.
+    """
+    if method is None:
+        return None
+    return (
+        method.is_staticmethod,
+        tuple(method.args),
+        method.varargs,
+        method.varkw,
+        tuple(method.kwonlyargs),
+        tuple(keyword for keyword, _ in method.get_keyword_only_args()),
+        len(method.defaults),
+    )
+
 
 class BaseControllerImplementation(ABC):
     def __init__(
@@ -30,7 +64,6 @@ class BaseControllerImplementation(ABC):
         name,
         bases,
         attrs,
-        stack_frame,
         pre_controller_enabled: bool = True,
         filter_enabled: bool = True,
         sort_key_enabled: bool = True,
@@ -44,7 +77,6 @@ class BaseControllerImplementation(ABC):
         self.name = name
         self.bases = bases
         self.attrs = attrs
-        self.stack_frame = stack_frame
 
         self.__pre_controller = (
             MethodInspector(self.attrs[PRE_CONTROLLER_METHOD_NAME])
@@ -113,16 +145,87 @@ class BaseControllerImplementation(ABC):
             )
 
     @abstractmethod
+    def generate_call_args(self) -> Tuple[ast.arguments, dict]:
+        """
+        Delegate to each controller implementation to create the signature of its call
+        method. This is always run, even when the call method code is cached, so that
+        argument validation and default values are resolved for every controller.
+
+        Returns:
+            Tuple[ast.arguments, dict]: Arguments for the generated call method, and the
+            saved argument defaults (see get_call_args).
+        """
+        ...
+
+    @abstractmethod
+    def generate_call_body(self) -> Tuple[List[ast.stmt], dict]:
+        """
+        Delegate to each controller implementation to create the body of its call method.
+
+        Returns:
+            Tuple[List[ast.stmt], dict]: The statements of the call method body, and any
+            additional global values those statements reference.
+        """
+        ...
+
     def generate_call_method(self) -> Callable[..., Any]:
         """
-        Delegate to each controller implementation to create its own call method.
-        This must return a callable method that will be bound to the classes __call__
-        dunder method. Each instance will be callable with the output of this method.
+        Creates the call method that will be bound to the classes __call__ dunder method.
+        Each instance will be callable with the output of this method.
+
+        The compiled code is shared between all controllers with the same call method key,
+        so the body is only generated and compiled once per controller shape. Each
+        controller then only builds a function object around it with its own defaults.
 
         Returns:
             Callable[..., Any]: __call__() method for the controller instances.
         """
-        ...
+        args, saved_defaults = self.generate_call_args()
+
+        key = self.get_call_method_key()
+        cached = _CALL_METHOD_CODE_CACHE.get(key)
+        if cached is None:
+            body, additional_globals = self.generate_call_body()
+            call_fn = ast.FunctionDef(
+                name=GENERATED_CALL_METHOD_NAME,
+                args=args,
+                body=body,
+                decorator_list=[],
+                type_params=[],
+            )
+            module = ast.fix_missing_locations(
+                ast.Module(body=[call_fn], type_ignores=[])
+            )
+            code = compile(module, filename="<ast>", mode="exec")
+            call_code = next(
+                const for const in code.co_consts if isinstance(const, CodeType)
+            )
+            call_globals = {"__builtins__": builtins, **additional_globals}
+            cached = _CALL_METHOD_CODE_CACHE[key] = (call_code, call_globals)
+
+        call_code, call_globals = cached
+        return self.create_call_method(call_code, call_globals, args, saved_defaults)
+
+    def get_call_method_key(self) -> tuple:
+        """
+        Describes the shape of the generated call method. Everything the generated code
+        depends on must be a part of this key; default values are excluded since they
+        are passed in as globals rather than compiled into the code.
+
+        Returns:
+            tuple: hashable key for the call method code cache.
+        """
+        return (
+            type(self),
+            getattr(self.cls, "reverse_sort", False),
+            _get_method_key(self.pre_controller),
+            _get_method_key(self.filter),
+            _get_method_key(self.sort_key),
+            _get_method_key(self.sort_cmp),
+            _get_method_key(self.action),
+            _get_method_key(self.fold),
+            _get_method_key(self.post_controller),
+        )
 
     ####
     # Read only properties
@@ -186,31 +289,135 @@ class BaseControllerImplementation(ABC):
     ####
     # Common helpers
 
-    def compile_call_method(
-        self, module: ast.Module, additional_globals: dict = None
+    def bind_method(self, body: List[ast.stmt], name: str, local_name: str) -> ast.Name:
+        """
+        Appends an assignment of the bound controlled method to a local variable of the
+        call method. Methods called once per element should be called through this
+        local so the attribute lookup on the instance is only done once per call.
+
+        Args:
+            body (List[ast.stmt]): call method body to append the assignment to.
+            name (str): attribute name of the controlled method.
+            local_name (str): local variable name to bind the method to.
+
+        Returns:
+            ast.Name: load of the local variable.
+        """
+        body.append(
+            ast.Assign(
+                targets=[ast.Name(id=local_name, ctx=STORE)],
+                value=ast.Attribute(value=CLASS_ARG_LOAD, attr=name, ctx=LOAD),
+            )
+        )
+        return load_name(local_name)
+
+    def get_chosen_call(self, method: MethodInspector, func: ast.AST) -> ast.Call:
+        """
+        Generates the invocation of a controlled method with its first argument
+        replaced by the chosen element of a comprehension or loop.
+
+        Args:
+            method (MethodInspector): controlled method to invoke.
+            func (ast.AST): callable expression used to invoke the method.
+
+        Returns:
+            ast.Call: call of the method on the chosen element.
+        """
+        invoke = MethodInvocation(method)
+        args, keywords = invoke.get_call_args_and_keywords()
+        args[0] = CHOSEN_ARG_LOAD
+        return invoke.to_function_call(args, keywords, func=func)
+
+    def get_filtered_elements(
+        self, body: List[ast.stmt], get_elements: ast.AST
+    ) -> ast.AST:
+        """
+        Wraps get_elements so only the elements accepted by the filter are produced.
+        Filters with additional parameters are inlined into a generator expression
+        rather than wrapped in a lambda, saving a call per element.
+
+        Args:
+            body (List[ast.stmt]): call method body, used to bind the filter locally.
+            get_elements (ast.AST): iterable of elements to filter.
+
+        Returns:
+            ast.AST: iterable of the filtered elements.
+        """
+        if self.filter.num_call_parameters == 1:
+            return ast.Call(
+                func=load_name("filter"),
+                args=[
+                    ast.Attribute(
+                        value=CLASS_ARG_LOAD,
+                        attr=FILTER_METHOD_NAME,
+                        ctx=LOAD,
+                    ),
+                    get_elements,
+                ],
+                keywords=[],
+            )
+
+        filter_fn = self.bind_method(body, FILTER_METHOD_NAME, FILTER_LOCAL_NAME)
+        return ast.GeneratorExp(
+            elt=CHOSEN_ARG_LOAD,
+            generators=[
+                ast.comprehension(
+                    target=ast.Name(id=CHOSEN_ARG_NAME, ctx=STORE),
+                    iter=get_elements,
+                    ifs=[self.get_chosen_call(self.filter, filter_fn)],
+                    is_async=0,
+                )
+            ],
+        )
+
+    def create_call_method(
+        self,
+        code: CodeType,
+        call_globals: dict,
+        args: ast.arguments,
+        saved_defaults: dict,
     ) -> Callable[..., Any]:
         """
-        Compiles the call method from within the passed in module for this controller.
+        Creates the call method for this controller directly from the compiled code of
+        the call function, without executing the module that defines it.
 
         Args:
-            module (ast.Module): module which contains the call function.
-            additional_globals (dict, optional): additional global values to include in compilation. Defaults to None.
+            code (CodeType): compiled code of the call function.
+            call_globals (dict): globals the call function runs with.
+            args (ast.arguments): arguments the call function was generated with.
+            saved_defaults (dict): saved argument defaults, keyed by argument name.
 
         Returns:
             Callable[..., Any]: generated call method for this controller.
         """
-        _globals = self.stack_frame.f_globals
-        _globals.update(self.stack_frame.f_locals)
-        if additional_globals is not None:
-            _globals.update(additional_globals)
-
-        _locals = {}
-        eval(
-            compile(module, filename="<ast>", mode="exec"),
-            _globals,
-            _locals,
+        defaults = tuple(saved_defaults[default.id] for default in args.defaults)
+        call_method = self.name_call_method(
+            FunctionType(
+                code, call_globals, GENERATED_CALL_METHOD_NAME, defaults or None
+            )
         )
-        return _locals[GENERATED_CALL_METHOD_NAME]
+        kwdefaults = {
+            arg.arg: saved_defaults[default.id]
+            for arg, default in zip(args.kwonlyargs, args.kw_defaults)
+            if default is not None  # required keyword only argument
+        }
+        if kwdefaults:
+            call_method.__kwdefaults__ = kwdefaults
+        return call_method
+
+    def name_call_method(self, call_method: FunctionType) -> FunctionType:
+        """
+        Names the call method as if it was defined alongside the controller.
+
+        Args:
+            call_method (FunctionType): call method of this controller.
+
+        Returns:
+            FunctionType: the same call method.
+        """
+        call_method.__module__ = self.cls.__module__
+        call_method.__qualname__ = GENERATED_CALL_METHOD_NAME
+        return call_method
 
     def get_call_args(
         self,
@@ -234,7 +441,8 @@ class BaseControllerImplementation(ABC):
 
         Keyword only and default arguments are allowed to shared the same name, but they must also
         share the same default argument. Duplicated keywords with different default values
-        are invalid, and an error will be thrown.
+        are invalid, and an error will be thrown. Keyword only arguments without a default
+        remain required, and may not be given a default by another controlled method.
 
         Variable args are supported, but any controlled method that uses them will be required to use
         the same vararg name.
@@ -244,6 +452,7 @@ class BaseControllerImplementation(ABC):
 
         Raises:
             AttributeError: for duplicate keyword/default IDs without the same default value.
+            ArgumentError: for a required keyword only argument that is given a default elsewhere.
 
         Returns:
             Tuple[ast.arguments, dict]: A tuple containing the Arguments for the generated call method, as
@@ -261,136 +470,67 @@ class BaseControllerImplementation(ABC):
 
         if use_class_arg:
             # add the class argument
-            posonlyargs.append(
-                ast.arg(arg=CLASS_ARG_NAME, annotation=None, type_comment=None)
-            )
+            posonlyargs.append(arg_node(CLASS_ARG_NAME))
 
         if use_k_arg:
             # add the dynamic_max_chosen K argument
-            posonlyargs.append(
-                ast.arg(arg=K_ARG_NAME, annotation=None, type_comment=None)
-            )
+            posonlyargs.append(arg_node(K_ARG_NAME))
 
         if use_partition_arg:
             # add the partition argument
-            posonlyargs.append(
-                ast.arg(arg=PARTITION_ARG_NAME, annotation=None, type_comment=None)
+            posonlyargs.append(arg_node(PARTITION_ARG_NAME))
+
+        # the controlled methods of this controller, in the order their parameters are merged
+        methods = [
+            (name, method, required_args)
+            for name, method, required_args in (
+                (
+                    PRE_CONTROLLER_METHOD_NAME,
+                    self.pre_controller,
+                    required_pre_controller_args,
+                ),
+                (FILTER_METHOD_NAME, self.filter, required_filter_args),
+                (SORT_KEY_METHOD_NAME, self.sort_key, required_sort_key_args),
+                (SORT_CMP_METHOD_NAME, self.sort_cmp, required_sort_cmp_args),
+                (ACTION_METHOD_NAME, self.action, required_action_args),
+                (FOLD_METHOD_NAME, self.fold, requried_fold_args),
+                (
+                    POST_CONTROLLER_METHOD_NAME,
+                    self.post_controller,
+                    required_post_controller_args,
+                ),
             )
+            if method is not None
+        ]
 
         # join the positional and non-defaulted arguments from the controlled methods
-        pre_controller_args = []
-        if self.has_pre_controller:
-            arg_start_index = 0 if self.pre_controller.is_staticmethod else 1
-            arg_start_index += required_pre_controller_args
-            pre_controller_args = self.pre_controller.get_non_defaulted_args()[
-                arg_start_index:
-            ]
-
-        filter_args = []
-        if self.has_filter:
-            arg_start_index = 0 if self.filter.is_staticmethod else 1
-            arg_start_index += required_filter_args
-            filter_args = self.filter.get_non_defaulted_args()[arg_start_index:]
-
-        sort_key_args = []
-        if self.has_sort_key:
-            arg_start_index = 0 if self.sort_key.is_staticmethod else 1
-            arg_start_index += required_sort_key_args
-            sort_key_args = self.sort_key.get_non_defaulted_args()[arg_start_index:]
-
-        sort_cmp_args = []
-        if self.has_sort_cmp:
-            arg_start_index = 0 if self.sort_cmp.is_staticmethod else 1
-            arg_start_index += required_sort_cmp_args
-            sort_cmp_args = self.sort_cmp.get_non_defaulted_args()[arg_start_index:]
-
-        action_args = []
-        if self.has_action:
-            arg_start_index = 0 if self.action.is_staticmethod else 1
-            arg_start_index += required_action_args
-            action_args = self.action.get_non_defaulted_args()[arg_start_index:]
-
-        fold_args = []
-        if self.has_fold:
-            arg_start_index = 0 if self.fold.is_staticmethod else 1
-            arg_start_index += requried_fold_args
-            fold_args = self.fold.get_non_defaulted_args()[arg_start_index:]
-
-        post_controller_args = []
-        if self.has_post_controller:
-            arg_start_index = 0 if self.post_controller.is_staticmethod else 1
-            arg_start_index += required_post_controller_args
-            post_controller_args = self.post_controller.get_non_defaulted_args()[
-                arg_start_index:
-            ]
+        positional_args = []
+        for name, method, required_args in methods:
+            arg_start_index = 0 if method.is_staticmethod else 1
+            arg_start_index += required_args
+            positional_args.append(
+                (name, method.get_non_defaulted_args()[arg_start_index:])
+            )
 
         max_args = max(
-            len(pre_controller_args),
-            len(filter_args),
-            len(sort_key_args),
-            len(sort_cmp_args),
-            len(action_args),
-            len(fold_args),
-            len(post_controller_args),
+            (len(method_args) for _, method_args in positional_args), default=0
         )
 
         # check each non-defaulted argument in each index and ensure its the same argument name
         shared_msg = "Shared positional arguments must have the same name across all controlled methods that use it."
         for index in range(0, max_args, 1):
             current_arg: Union[str, None] = None
-            if len(pre_controller_args) > index:
-                current_arg = pre_controller_args[index]
-
-            if len(filter_args) > index:
-                if current_arg is None:
-                    current_arg = filter_args[index]
-                elif current_arg != filter_args[index]:
-                    msg = f'{FILTER_METHOD_NAME} argument {index} "{filter_args[index]}" is positionally shared with "{current_arg}"; choose one name for this argument.'
-                    msg += shared_msg
-                    raise ArgumentError(msg)
-
-            if len(sort_key_args) > index:
-                if current_arg is None:
-                    current_arg = sort_key_args[index]
-                elif current_arg != sort_key_args[index]:
-                    msg = f'{SORT_KEY_METHOD_NAME} argument {index} "{sort_key_args[index]}" is positionally shared with "{current_arg}"; choose one name for this argument. '
-                    msg += shared_msg
-                    raise ArgumentError(msg)
-
-            if len(sort_cmp_args) > index:
-                if current_arg is None:
-                    current_arg = sort_cmp_args[index]
-                elif current_arg != sort_cmp_args[index]:
-                    msg = f'{SORT_CMP_METHOD_NAME} argument {index} "{sort_cmp_args[index]}" is positionally shared with "{current_arg}"; choose one name for this argument. '
-                    msg += shared_msg
-                    raise ArgumentError(msg)
-
-            if len(action_args) > index:
-                if current_arg is None:
-                    current_arg = action_args[index]
-                elif current_arg != action_args[index]:
-                    msg = f'{ACTION_METHOD_NAME} argument {index} "{action_args[index]}" is positionally shared with "{current_arg}"; choose one name for this argument. '
-                    msg += shared_msg
-                    raise ArgumentError(msg)
-
-            if len(fold_args) > index:
-                if current_arg is None:
-                    current_arg = fold_args[index]
-                elif current_arg != fold_args[index]:
-                    msg = f'{FOLD_METHOD_NAME} argument {index} "{fold_args[index]}" is positionally shared with "{current_arg}"; choose one name for this argument. '
-                    msg += shared_msg
-                    raise ArgumentError(msg)
-
-            if len(post_controller_args) > index:
-                if current_arg is None:
-                    current_arg = post_controller_args[index]
-                elif current_arg != post_controller_args[index]:
-                    msg = f'{POST_CONTROLLER_METHOD_NAME} argument {index} "{post_controller_args[index]}" is positionally shared with "{current_arg}"; choose one name for this argument. '
-                    msg += shared_msg
-                    raise ArgumentError(msg)
+            for name, method_args in positional_args:
+                if len(method_args) > index:
+                    if current_arg is None:
+                        current_arg = method_args[index]
+                    elif current_arg != method_args[index]:
+                        msg = f'{name} argument {index} "{method_args[index]}" is positionally shared with "{current_arg}"; choose one name for this argument. '
+                        msg += shared_msg
+                        raise ArgumentError(msg)
 
             if current_arg is not None:
-                args.append(ast.arg(arg=current_arg, annotation=None))
+                args.append(arg_node(current_arg))
 
         # defined as an inner function to pass args and saved_global_kwargs into the namespace
         def _should_include_arg(
@@ -439,231 +579,69 @@ class BaseControllerImplementation(ABC):
         ) -> None:
             for keyword, value in keyword_values:
                 if _should_include_arg(keyword, value, [arg.arg for arg in args]):
-                    args.append(ast.arg(arg=keyword, annotation=None))
+                    args.append(arg_node(keyword))
                     global_keyword_name = f"{keyword}"
                     saved_defaults[global_keyword_name] = value
-                    defaults.append(ast.Name(id=global_keyword_name, ctx=ast.Load()))
+                    defaults.append(load_name(global_keyword_name))
+
+        # keyword only arguments without a default stay required in the call method,
+        # so no controlled method may give one of them a default
+        required_keywords = {}
+        for name, method, _ in methods:
+            for keyword in method.get_non_defaulted_keyword_only_args():
+                required_keywords.setdefault(keyword, name)
+        for name, method, _ in methods:
+            for keyword, _ in method.get_keyword_only_args():
+                if keyword in required_keywords:
+                    raise ArgumentError(
+                        f'{name} gives the keyword only argument "{keyword}" a default value, but it is required by {required_keywords[keyword]}. '
+                        "Shared keyword only arguments must either all be required or all share the same default value."
+                    )
 
         # get the defaulted arguments and keyword only arguments
-        if self.has_pre_controller:
-            add_non_conflicting_parameters(
-                self.pre_controller.get_defaulted_args(), args, defaults
-            )
-            add_non_conflicting_parameters(
-                self.pre_controller.get_keyword_only_args(), kwonlyargs, kw_defaults
-            )
-
-        if self.has_filter:
-            add_non_conflicting_parameters(
-                self.filter.get_defaulted_args(), args, defaults
-            )
-            add_non_conflicting_parameters(
-                self.filter.get_keyword_only_args(), kwonlyargs, kw_defaults
-            )
-
-        if self.has_sort_key:
-            add_non_conflicting_parameters(
-                self.sort_key.get_defaulted_args(), args, defaults
-            )
-            add_non_conflicting_parameters(
-                self.sort_key.get_keyword_only_args(),
-                kwonlyargs,
-                kw_defaults,
-            )
-
-        if self.has_sort_cmp:
-            add_non_conflicting_parameters(
-                self.sort_cmp.get_defaulted_args(), args, defaults
-            )
+        for _, method, _ in methods:
+            add_non_conflicting_parameters(method.get_defaulted_args(), args, defaults)
             add_non_conflicting_parameters(
-                self.sort_cmp.get_keyword_only_args(),
-                kwonlyargs,
-                kw_defaults,
+                method.get_keyword_only_args(), kwonlyargs, kw_defaults
             )
 
-        if self.has_action:
-            add_non_conflicting_parameters(
-                self.action.get_defaulted_args(), args, defaults
-            )
-            add_non_conflicting_parameters(
-                self.action.get_keyword_only_args(), kwonlyargs, kw_defaults
-            )
-
-        if self.has_fold:
-            add_non_conflicting_parameters(
-                self.fold.get_defaulted_args(), args, defaults
-            )
-            add_non_conflicting_parameters(
-                self.fold.get_keyword_only_args(), kwonlyargs, kw_defaults
-            )
-
-        if self.has_post_controller:
-            add_non_conflicting_parameters(
-                self.post_controller.get_defaulted_args(), args, defaults
-            )
-            add_non_conflicting_parameters(
-                self.post_controller.get_keyword_only_args(), kwonlyargs, kw_defaults
-            )
+        for keyword in required_keywords:
+            kwonlyargs.append(arg_node(keyword))
+            kw_defaults.append(None)
 
         # check for arg unpacks
         arg_unpack_name = None
-        if self.has_pre_controller:
-            arg_unpack_name = self.pre_controller.varargs
-        if self.has_filter:
-            if arg_unpack_name is None:
-                arg_unpack_name = self.filter.varargs
-            elif self.filter.has_arg_unpack and self.filter.varargs != arg_unpack_name:
-                raise ArgumentError(
-                    dedent(
-                        f'{FILTER_METHOD_NAME} controlled action uses "{self.filter.varargs}" as the argument unpack variable name, \
-                    but it was previously defined as "{arg_unpack_name}". \
-                    The argument unpack variable must be the same name across all controlled methods that use it.'
-                    )
-                )
-        if self.has_sort_key:
-            if arg_unpack_name is None:
-                arg_unpack_name = self.sort_key.varargs
-            elif (
-                self.sort_key.has_arg_unpack
-                and self.sort_key.varargs != arg_unpack_name
-            ):
-                raise ArgumentError(
-                    dedent(
-                        f'{SORT_KEY_METHOD_NAME} controlled action uses "{self.sort_key.varargs}" as the argument unpack variable name, \
-                    but it was previously defined as "{arg_unpack_name}". \
-                    The argument unpack variable must be the same name across all controlled methods that use it.'
-                    )
-                )
-        if self.has_sort_cmp:
-            if arg_unpack_name is None:
-                arg_unpack_name = self.sort_cmp.varargs
-            elif (
-                self.sort_cmp.has_arg_unpack
-                and self.sort_cmp.varargs != arg_unpack_name
-            ):
-                raise ArgumentError(
-                    dedent(
-                        f'{SORT_CMP_METHOD_NAME} controlled action uses "{self.sort_cmp.varargs}" as the argument unpack variable name, \
-                    but it was previously defined as "{arg_unpack_name}". \
-                    The argument unpack variable must be the same name across all controlled methods that use it.'
-                    )
-                )
-        if self.has_action:
-            if arg_unpack_name is None:
-                arg_unpack_name = self.action.varargs
-            elif self.action.has_arg_unpack and self.action.varargs != arg_unpack_name:
-                raise ArgumentError(
-                    dedent(
-                        f'{ACTION_METHOD_NAME} controlled action uses "{self.action.varargs}" as the argument unpack variable name, \
-                    but it was previously defined as "{arg_unpack_name}". \
-                    The argument unpack variable must be the same name across all controlled methods that use it.'
-                    )
-                )
-        if self.has_fold:
+        for name, method, _ in methods:
             if arg_unpack_name is None:
-                arg_unpack_name = self.fold.varargs
-            elif self.fold.has_arg_unpack and self.fold.varargs != arg_unpack_name:
+                arg_unpack_name = method.varargs
+            elif method.has_arg_unpack and method.varargs != arg_unpack_name:
                 raise ArgumentError(
                     dedent(
-                        f'{FOLD_METHOD_NAME} controlled action uses "{self.fold.varargs}" as the argument unpack variable name, \
-                    but it was previously defined as "{arg_unpack_name}". \
-                    The argument unpack variable must be the same name across all controlled methods that use it.'
-                    )
-                )
-        if self.has_post_controller:
-            if arg_unpack_name is None:
-                arg_unpack_name = self.post_controller.varargs
-            elif (
-                self.post_controller.has_arg_unpack
-                and self.post_controller.varargs != arg_unpack_name
-            ):
-                raise ArgumentError(
-                    dedent(
-                        f'{POST_CONTROLLER_METHOD_NAME} controlled action uses "{self.post_controller.varargs}" as the argument unpack variable name, \
+                        f'{name} controlled action uses "{method.varargs}" as the argument unpack variable name, \
                     but it was previously defined as "{arg_unpack_name}". \
                     The argument unpack variable must be the same name across all controlled methods that use it.'
                     )
                 )
 
         if arg_unpack_name is not None:
-            var_arg = ast.arg(arg=arg_unpack_name, annotation=None)
+            var_arg = arg_node(arg_unpack_name)
 
         # check for kwarg unpacks
         kwarg_name = None
-        if self.has_pre_controller:
-            kwarg_name = self.pre_controller.varkw
-        if self.has_filter:
-            if kwarg_name is None:
-                kwarg_name = self.filter.varkw
-            elif self.filter.has_kwarg_unpack and self.filter.varkw != kwarg_name:
-                raise ArgumentError(
-                    dedent(
-                        f'{FILTER_METHOD_NAME} controlled action uses "{self.filter.varkw}" as the keyword argument unpack variable name, \
-                    but it was previously defined as "{kwarg_name}". \
-                    The keyword argument unpack variable must be the same name across all controlled methods that use it.'
-                    )
-                )
-        if self.has_sort_key:
-            if kwarg_name is None:
-                kwarg_name = self.sort_key.varkw
-            elif self.sort_key.has_kwarg_unpack and self.sort_key.varkw != kwarg_name:
-                raise ArgumentError(
-                    dedent(
-                        f'{SORT_KEY_METHOD_NAME} controlled action uses "{self.sort_key.varkw}" as the keyword argument unpack variable name, \
-                    but it was previously defined as "{kwarg_name}". \
-                    The keyword argument unpack variable must be the same name across all controlled methods that use it.'
-                    )
-                )
-        if self.has_sort_cmp:
-            if kwarg_name is None:
-                kwarg_name = self.sort_cmp.varkw
-            elif self.sort_cmp.has_kwarg_unpack and self.sort_cmp.varkw != kwarg_name:
-                raise ArgumentError(
-                    dedent(
-                        f'{SORT_CMP_METHOD_NAME} controlled action uses "{self.sort_cmp.varkw}" as the keyword argument unpack variable name, \
-                    but it was previously defined as "{kwarg_name}". \
-                    The keyword argument unpack variable must be the same name across all controlled methods that use it.'
-                    )
-                )
-        if self.has_action:
-            if kwarg_name is None:
-                kwarg_name = self.action.varkw
-            elif self.action.has_kwarg_unpack and self.action.varkw != kwarg_name:
-                raise ArgumentError(
-                    dedent(
-                        f'{ACTION_METHOD_NAME} controlled action uses "{self.action.varkw}" as the keyword argument unpack variable name, \
-                    but it was previously defined as "{kwarg_name}". \
-                    The keyword argument unpack variable must be the same name across all controlled methods that use it.'
-                    )
-                )
-        if self.has_fold:
-            if kwarg_name is None:
-                kwarg_name = self.fold.varkw
-            elif self.fold.has_kwarg_unpack and self.fold.varkw != kwarg_name:
-                raise ArgumentError(
-                    dedent(
-                        f'{FOLD_METHOD_NAME} controlled action uses "{self.fold.varkw}" as the keyword argument unpack variable name, \
-                    but it was previously defined as "{kwarg_name}". \
-                    The keyword argument unpack variable must be the same name across all controlled methods that use it.'
-                    )
-                )
-        if self.has_post_controller:
+        for name, method, _ in methods:
             if kwarg_name is None:
-                kwarg_name = self.post_controller.varkw
-            elif (
-                self.post_controller.has_kwarg_unpack
-                and self.post_controller.varkw != kwarg_name
-            ):
+                kwarg_name = method.varkw
+            elif method.has_kwarg_unpack and method.varkw != kwarg_name:
                 raise ArgumentError(
                     dedent(
-                        f'{POST_CONTROLLER_METHOD_NAME} controlled action uses "{self.post_controller.varkw}" as the keyword argument unpack variable name, \
+                        f'{name} controlled action uses "{method.varkw}" as the keyword argument unpack variable name, \
                     but it was previously defined as "{kwarg_name}". \
                     The keyword argument unpack variable must be the same name across all controlled methods that use it.'
                     )
                 )
 
         if kwarg_name is not None:
-            kwarg = ast.arg(arg=kwarg_name, annotation=None)
+            kwarg = arg_node(kwarg_name)
 
         # create the signatures arguments
         func_args = ast.arguments(
@@ -1,12 +1,12 @@
 import ast
 import warnings
-from typing import Any, Callable
+from typing import List, Tuple
 
+from metacontrollers.internal.ast_nodes import ACTION_RESULT_LOAD, STORE
 from metacontrollers.internal.method_invocation import MethodInvocation
 from metacontrollers.internal.namespace import (
     ACTION_METHOD_NAME,
     ACTION_RESULT_ASSIGNMENT_NAME,
-    GENERATED_CALL_METHOD_NAME,
     POST_CONTROLLER_METHOD_NAME,
     PRE_CONTROLLER_METHOD_NAME,
 )
@@ -15,13 +15,12 @@ from ._base import BaseControllerImplementation
 
 
 class DoImplementation(BaseControllerImplementation):
-    def __init__(self, cls, name, bases, attrs, stack_frame) -> None:
+    def __init__(self, cls, name, bases, attrs) -> None:
         super().__init__(
             cls,
             name,
             bases,
             attrs,
-            stack_frame,
             filter_enabled=False,
             sort_key_enabled=False,
             sort_cmp_enabled=False,
@@ -45,7 +44,7 @@ class DoImplementation(BaseControllerImplementation):
                 "Fold is not supported for Do controllers. It will be ignored."
             )
 
-    def generate_call_method(self) -> Callable[..., Any]:
+    def generate_call_body(self) -> Tuple[List[ast.stmt], dict]:
         body = []
 
         if self.has_pre_controller:
@@ -56,7 +55,7 @@ class DoImplementation(BaseControllerImplementation):
 
         if self.has_action:
             result = ast.Assign(
-                targets=[ast.Name(id=ACTION_RESULT_ASSIGNMENT_NAME, ctx=ast.Store())],
+                targets=[ast.Name(id=ACTION_RESULT_ASSIGNMENT_NAME, ctx=STORE)],
                 value=MethodInvocation(self.action).to_function_call(
                     name=ACTION_METHOD_NAME
                 ),
@@ -70,25 +69,14 @@ class DoImplementation(BaseControllerImplementation):
             body.append(ast.Expr(value=post_controller_call))
 
         if self.has_action:
-            body.append(
-                ast.Return(
-                    value=ast.Name(id=ACTION_RESULT_ASSIGNMENT_NAME, ctx=ast.Load())
-                )
-            )
+            body.append(ast.Return(value=ACTION_RESULT_LOAD))
+
+        return body, {}
 
-        args, saved_defaults = self.get_call_args(
+    def generate_call_args(self) -> Tuple[ast.arguments, dict]:
+        return self.get_call_args(
             use_class_arg=True,
             use_k_arg=False,
             use_partition_arg=False,
             required_action_args=0,
         )
-        call_fn = ast.FunctionDef(
-            name=GENERATED_CALL_METHOD_NAME,
-            args=args,
-            body=body,
-            decorator_list=[],
-            type_params=[],
-        )
-
-        module = ast.fix_missing_locations(ast.Module(body=[call_fn], type_ignores=[]))
-        return self.compile_call_method(module, saved_defaults)
@@ -1,20 +1,29 @@
 import ast
 from functools import cmp_to_key
-from typing import Any, Callable
+from types import FunctionType
+from typing import Any, Callable, List, Tuple, Union
 
+from metacontrollers.internal.ast_nodes import (
+    ACTION_RESULT_LOAD,
+    PARTITION_ARG_LOAD,
+    STORE,
+    load_name,
+)
 from metacontrollers.internal.exceptions import (
     InvalidControllerMethodError,
     InvalidReturnError,
 )
+from metacontrollers.internal.method_inspector import MethodInspector
 from metacontrollers.internal.method_invocation import MethodInvocation
 from metacontrollers.internal.namespace import (
+    ACTION_LOCAL_NAME,
     ACTION_METHOD_NAME,
     ACTION_RESULT_ASSIGNMENT_NAME,
-    CLASS_ARG_NAME,
+    CHOSEN_ARG_NAME,
+    FILTER_LOCAL_NAME,
     FILTER_METHOD_NAME,
     FOLD_METHOD_NAME,
     GENERATED_CALL_METHOD_NAME,
-    PARTITION_ARG_NAME,
     POST_CONTROLLER_METHOD_NAME,
     PRE_CONTROLLER_METHOD_NAME,
     SORT_CMP_METHOD_NAME,
@@ -24,9 +33,46 @@ from metacontrollers.internal.namespace import (
 from ._base import BaseControllerImplementation
 
 
+# prewritten call methods for the trivial controller shapes, see get_call_template()
+def _call_map_action(self, partition, /):
+    return list(map(self.action, partition))
+
+
+def _call_each_action(self, partition, /):
+    action = self.action
+    for chosen in partition:
+        action(chosen)
+
+
+def _call_filter(self, partition, /):
+    return list(filter(self.filter, partition))
+
+
+def _call_lazy_map_action(self, partition, /):
+    return map(self.action, partition)
+
+
+def _call_lazy_filter(self, partition, /):
+    return filter(self.filter, partition)
+
+
+def _takes_only_chosen(method: MethodInspector) -> bool:
+    """
+    Checks that the method can be called with the chosen element alone, and that no
+    argument of it has to be a part of the call method signature.
+    """
+    return (
+        len(method.call_args) == 1
+        and not method.defaults
+        and not method.kwonlyargs
+        and not method.has_arg_unpack
+        and not method.has_kwarg_unpack
+    )
+
+
 class DoAllImplementation(BaseControllerImplementation):
-    def __init__(self, cls, name, bases, attrs, stack_frame) -> None:
-        super().__init__(cls, name, bases, attrs, stack_frame)
+    def __init__(self, cls, name, bases, attrs) -> None:
+        super().__init__(cls, name, bases, attrs)
 
     def validate(self) -> None:
         super().validate()
@@ -70,10 +116,60 @@ class DoAllImplementation(BaseControllerImplementation):
                     f'"{FOLD_METHOD_NAME}" was defined, but "{ACTION_METHOD_NAME}" does not return anything.'
                 )
 
+    def get_call_method_key(self) -> tuple:
+        # the action's return determines whether results are collected
+        return super().get_call_method_key() + (
+            self.action.returns_a_value if self.has_action else None,
+            self.cls.lazy,
+        )
+
     def generate_call_method(self) -> Callable[..., Any]:
+        template = self.get_call_template()
+        if template is not None:
+            # the template's code is shared, but each controller gets its own function
+            return self.name_call_method(
+                FunctionType(
+                    template.__code__, template.__globals__, GENERATED_CALL_METHOD_NAME
+                )
+            )
+        return super().generate_call_method()
+
+    def get_call_template(self) -> Union[Callable[..., Any], None]:
+        """
+        Returns a prewritten call method when the controller only has an action or only
+        has a filter, and that method takes nothing but the chosen element. These shapes
+        skip generating and compiling a call method, and every controller of the same
+        shape shares one code object.
+
+        Returns:
+            Union[Callable[..., Any], None]: the call method, or None if one must be generated.
+        """
+        if (
+            self.has_pre_controller
+            or self.has_sort_key
+            or self.has_sort_cmp
+            or self.has_fold
+            or self.has_post_controller
+        ):
+            return None
+
+        if self.has_action and not self.has_filter:
+            if _takes_only_chosen(self.action):
+                if not self.action.returns_a_value:
+                    return _call_each_action
+                return _call_lazy_map_action if self.cls.lazy else _call_map_action
+        elif self.has_filter and not self.has_action:
+            if _takes_only_chosen(self.filter):
+                return _call_lazy_filter if self.cls.lazy else _call_filter
+        return None
+
+    def generate_call_body(self) -> Tuple[List[ast.stmt], dict]:
         body = []
         additional_globals = {}
-        get_elements = ast.Name(id=PARTITION_ARG_NAME, ctx=ast.Load())
+        get_elements = PARTITION_ARG_LOAD
+        # results are only kept as an iterator when nothing else consumes them, and
+        # nothing has to run after the actions
+        lazy = self.cls.lazy and not self.has_fold and not self.has_post_controller
 
         if self.has_pre_controller:
             pre_controller_call = MethodInvocation(
@@ -81,34 +177,21 @@ class DoAllImplementation(BaseControllerImplementation):
             ).to_function_call(name=PRE_CONTROLLER_METHOD_NAME)
             body.append(ast.Expr(value=pre_controller_call))
 
-        if self.has_filter:
-            if self.filter.num_call_parameters != 1:
-                filter_fn = MethodInvocation(self.filter).to_lambda(
-                    [self.filter.call_args[0]], name=FILTER_METHOD_NAME
-                )
-            else:
-                filter_fn = ast.Attribute(
-                    value=ast.Name(id=CLASS_ARG_NAME, ctx=ast.Load()),
-                    attr=FILTER_METHOD_NAME,
-                    ctx=ast.Load(),
-                )
-            get_elements = ast.Call(
-                func=ast.Name(id="filter", ctx=ast.Load()),
-                args=[filter_fn, get_elements],
-                keywords=[],
-            )
+        # without a sort, the filter is fused with the action into a single pass
+        fuse_filter = (
+            self.has_filter
+            and self.has_action
+            and not self.has_sort_key
+            and not self.has_sort_cmp
+        )
+
+        if self.has_filter and not fuse_filter:
+            get_elements = self.get_filtered_elements(body, get_elements)
 
         if self.has_sort_key:
-            if self.sort_key.num_call_parameters != 1:
-                sort_fn = MethodInvocation(self.sort_key).to_lambda(
-                    [self.sort_key.call_args[0]], name=SORT_KEY_METHOD_NAME
-                )
-            else:
-                sort_fn = ast.Attribute(
-                    value=ast.Name(id=CLASS_ARG_NAME, ctx=ast.Load()),
-                    attr=SORT_KEY_METHOD_NAME,
-                    ctx=ast.Load(),
-                )
+            sort_fn = MethodInvocation(self.sort_key).to_callable(
+                [self.sort_key.call_args[0]], name=SORT_KEY_METHOD_NAME
+            )
 
             sort_keywords = [ast.keyword(arg="key", value=sort_fn)]
             if self.cls.reverse_sort:
@@ -118,28 +201,21 @@ class DoAllImplementation(BaseControllerImplementation):
                     )
                 )
             get_elements = ast.Call(
-                func=ast.Name(id="sorted", ctx=ast.Load()),
+                func=load_name("sorted"),
                 args=[get_elements],
                 keywords=sort_keywords,
             )
 
         if self.has_sort_cmp:
-            if self.sort_cmp.num_call_parameters != 2:
-                sort_fn = MethodInvocation(self.sort_cmp).to_lambda(
-                    self.sort_cmp.call_args[:2], name=SORT_CMP_METHOD_NAME
-                )
-            else:
-                sort_fn = ast.Attribute(
-                    value=ast.Name(id=CLASS_ARG_NAME, ctx=ast.Load()),
-                    attr=SORT_CMP_METHOD_NAME,
-                    ctx=ast.Load(),
-                )
+            sort_fn = MethodInvocation(self.sort_cmp).to_callable(
+                self.sort_cmp.call_args[:2], name=SORT_CMP_METHOD_NAME
+            )
 
             sort_keywords = [
                 ast.keyword(
                     arg="key",
                     value=ast.Call(
-                        func=ast.Name(id="cmp_to_key", ctx=ast.Load()),
+                        func=load_name("cmp_to_key"),
                         args=[sort_fn],
                         keywords=[],
                     ),
@@ -152,7 +228,7 @@ class DoAllImplementation(BaseControllerImplementation):
                     )
                 )
             get_elements = ast.Call(
-                func=ast.Name(id="sorted", ctx=ast.Load()),
+                func=load_name("sorted"),
                 args=[get_elements],
                 keywords=sort_keywords,
             )
@@ -162,49 +238,80 @@ class DoAllImplementation(BaseControllerImplementation):
             action_invoke = MethodInvocation(self.action)
             action_args, action_keywords = action_invoke.get_call_args_and_keywords()
 
-            if self.action.returns_a_value:
-                # we should capture the results using map
-                if self.action.num_call_parameters != 1:
-                    # action has additional parameters, use a lambda
-                    action_fn = action_invoke.to_lambda(
-                        [action_args[0].id], name=ACTION_METHOD_NAME
+            if fuse_filter:
+                filter_fn = self.bind_method(
+                    body, FILTER_METHOD_NAME, FILTER_LOCAL_NAME
+                )
+                action_fn = self.bind_method(
+                    body, ACTION_METHOD_NAME, ACTION_LOCAL_NAME
+                )
+                action_call = self.get_chosen_call(self.action, action_fn)
+                filter_call = self.get_chosen_call(self.filter, filter_fn)
+
+                if self.action.returns_a_value:
+                    # [action(chosen) for chosen in partition if filter(chosen)]
+                    action = ast.Assign(
+                        targets=[ast.Name(id=ACTION_RESULT_ASSIGNMENT_NAME, ctx=STORE)],
+                        value=(ast.GeneratorExp if lazy else ast.ListComp)(
+                            elt=action_call,
+                            generators=[
+                                ast.comprehension(
+                                    target=ast.Name(id=CHOSEN_ARG_NAME, ctx=STORE),
+                                    iter=get_elements,
+                                    ifs=[filter_call],
+                                    is_async=0,
+                                )
+                            ],
+                        ),
                     )
                 else:
-                    # action only takes the required chosen parameter
-                    action_fn = ast.Attribute(
-                        value=ast.Name(id=CLASS_ARG_NAME, ctx=ast.Load()),
-                        attr=ACTION_METHOD_NAME,
-                        ctx=ast.Load(),
+                    action = ast.For(
+                        target=ast.Name(id=CHOSEN_ARG_NAME, ctx=STORE),
+                        iter=get_elements,
+                        body=[
+                            ast.If(
+                                test=filter_call,
+                                body=[ast.Expr(value=action_call)],
+                                orelse=[],
+                            )
+                        ],
+                        orelse=[],
                     )
+                body.append(action)
+
+            elif self.action.returns_a_value:
+                # we should capture the results using map
+                action_fn = action_invoke.to_callable(
+                    [action_args[0].id], name=ACTION_METHOD_NAME
+                )
 
                 action_call = ast.Call(
-                    func=ast.Name(id="list", ctx=ast.Load()),
-                    args=[
-                        ast.Call(
-                            func=ast.Name(id="map", ctx=ast.Load()),
-                            args=[action_fn, get_elements],
-                            keywords=[],
-                        )
-                    ],
+                    func=load_name("map"),
+                    args=[action_fn, get_elements],
                     keywords=[],
                 )
+                if not lazy:
+                    action_call = ast.Call(
+                        func=load_name("list"), args=[action_call], keywords=[]
+                    )
                 action = ast.Assign(
-                    targets=[
-                        ast.Name(id=ACTION_RESULT_ASSIGNMENT_NAME, ctx=ast.Store())
-                    ],
+                    targets=[ast.Name(id=ACTION_RESULT_ASSIGNMENT_NAME, ctx=STORE)],
                     value=action_call,
                 )
                 body.append(action)
 
             else:
                 # no need to capture the result from the action, so use a basic for loop
+                action_fn = self.bind_method(
+                    body, ACTION_METHOD_NAME, ACTION_LOCAL_NAME
+                )
                 action = ast.For(
-                    target=ast.Name(id=action_args[0].id, ctx=ast.Store()),
+                    target=ast.Name(id=action_args[0].id, ctx=STORE),
                     iter=get_elements,
                     body=[
                         ast.Expr(
                             value=action_invoke.to_function_call(
-                                action_args, action_keywords, name=ACTION_METHOD_NAME
+                                action_args, action_keywords, func=action_fn
                             )
                         )
                     ],
@@ -218,14 +325,12 @@ class DoAllImplementation(BaseControllerImplementation):
             fold_args.pop(0)
 
             if self.has_action:
-                fold_args.insert(
-                    0, ast.Name(id=ACTION_RESULT_ASSIGNMENT_NAME, ctx=ast.Load())
-                )
+                fold_args.insert(0, ACTION_RESULT_LOAD)
             else:
                 fold_args.insert(0, get_elements)
 
             fold_assignment = ast.Assign(
-                targets=[ast.Name(id=ACTION_RESULT_ASSIGNMENT_NAME, ctx=ast.Store())],
+                targets=[ast.Name(id=ACTION_RESULT_ASSIGNMENT_NAME, ctx=STORE)],
                 value=fold_invoke.to_function_call(
                     fold_args, fold_keywords, name=FOLD_METHOD_NAME
                 ),
@@ -234,15 +339,15 @@ class DoAllImplementation(BaseControllerImplementation):
 
         elif not self.has_action:
             # does not have an action, return whatever is get_elements
-            if not self.has_sort_cmp and not self.has_sort_key:
+            if not self.has_sort_cmp and not self.has_sort_key and not lazy:
                 # we need to convert the filter object to a list before we return
                 get_elements = ast.Call(
-                    func=ast.Name(id="list", ctx=ast.Load()),
+                    func=load_name("list"),
                     args=[get_elements],
                     keywords=[],
                 )
             get_elements_result = ast.Assign(
-                targets=[ast.Name(id=ACTION_RESULT_ASSIGNMENT_NAME, ctx=ast.Store())],
+                targets=[ast.Name(id=ACTION_RESULT_ASSIGNMENT_NAME, ctx=STORE)],
                 value=get_elements,
             )
             body.append(get_elements_result)
@@ -256,25 +361,13 @@ class DoAllImplementation(BaseControllerImplementation):
         if not self.has_fold and (self.has_action and not self.action.returns_a_value):
             pass  # do nothing since we explicitly do not need a return value here
         else:
-            body.append(
-                ast.Return(
-                    value=ast.Name(id=ACTION_RESULT_ASSIGNMENT_NAME, ctx=ast.Load())
-                )
-            )
+            body.append(ast.Return(value=ACTION_RESULT_LOAD))
 
-        args, saved_defaults = self.get_call_args(
+        return body, additional_globals
+
+    def generate_call_args(self) -> Tuple[ast.arguments, dict]:
+        return self.get_call_args(
             use_class_arg=True,
             use_k_arg=False,
             use_partition_arg=True,
         )
-        additional_globals.update(saved_defaults)
-        call_fn = ast.FunctionDef(
-            name=GENERATED_CALL_METHOD_NAME,
-            args=args,
-            body=body,
-            decorator_list=[],
-            type_params=[],
-        )
-
-        module = ast.fix_missing_locations(ast.Module(body=[call_fn], type_ignores=[]))
-        return self.compile_call_method(module, additional_globals)
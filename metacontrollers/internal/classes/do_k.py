@@ -2,22 +2,26 @@ import ast
 from functools import cmp_to_key
 from heapq import nlargest, nsmallest
 from itertools import islice
-from typing import Any, Callable
-
+from typing import List, Tuple
+
+from metacontrollers.internal.ast_nodes import (
+    ACTION_RESULT_LOAD,
+    K_ARG_LOAD,
+    PARTITION_ARG_LOAD,
+    STORE,
+    load_name,
+)
 from metacontrollers.internal.exceptions import (
     InvalidControllerMethodError,
     InvalidReturnError,
 )
 from metacontrollers.internal.method_invocation import MethodInvocation
 from metacontrollers.internal.namespace import (
+    ACTION_LOCAL_NAME,
     ACTION_METHOD_NAME,
     ACTION_RESULT_ASSIGNMENT_NAME,
-    CLASS_ARG_NAME,
     FILTER_METHOD_NAME,
     FOLD_METHOD_NAME,
-    GENERATED_CALL_METHOD_NAME,
-    K_ARG_NAME,
-    PARTITION_ARG_NAME,
     POST_CONTROLLER_METHOD_NAME,
     PRE_CONTROLLER_METHOD_NAME,
     SORT_CMP_METHOD_NAME,
@@ -28,8 +32,8 @@ from ._base import BaseControllerImplementation
 
 
 class DoKImplementation(BaseControllerImplementation):
-    def __init__(self, cls, name, bases, attrs, stack_frame) -> None:
-        super().__init__(cls, name, bases, attrs, stack_frame)
+    def __init__(self, cls, name, bases, attrs) -> None:
+        super().__init__(cls, name, bases, attrs)
 
     def validate(self) -> None:
         super().validate()
@@ -73,10 +77,16 @@ class DoKImplementation(BaseControllerImplementation):
                     f'"{FOLD_METHOD_NAME}" was defined, but "{ACTION_METHOD_NAME}" does not return anything.'
                 )
 
-    def generate_call_method(self) -> Callable[..., Any]:
+    def get_call_method_key(self) -> tuple:
+        # the action's return determines whether results are collected
+        return super().get_call_method_key() + (
+            self.action.returns_a_value if self.has_action else None,
+        )
+
+    def generate_call_body(self) -> Tuple[List[ast.stmt], dict]:
         body = []
         additional_globals = {}
-        get_elements = ast.Name(id=PARTITION_ARG_NAME, ctx=ast.Load())
+        get_elements = PARTITION_ARG_LOAD
 
         if self.has_pre_controller:
             pre_controller_call = MethodInvocation(
@@ -85,74 +95,46 @@ class DoKImplementation(BaseControllerImplementation):
             body.append(ast.Expr(value=pre_controller_call))
 
         if self.has_filter:
-            if self.filter.num_call_parameters != 1:
-                filter_fn = MethodInvocation(self.filter).to_lambda(
-                    [self.filter.call_args[0]], name=FILTER_METHOD_NAME
-                )
-            else:
-                filter_fn = ast.Attribute(
-                    value=ast.Name(id=CLASS_ARG_NAME, ctx=ast.Load()),
-                    attr=FILTER_METHOD_NAME,
-                    ctx=ast.Load(),
-                )
-            get_elements = ast.Call(
-                func=ast.Name(id="filter", ctx=ast.Load()),
-                args=[filter_fn, get_elements],
-                keywords=[],
-            )
+            get_elements = self.get_filtered_elements(body, get_elements)
 
         if self.has_sort_key:
-            if self.sort_key.num_call_parameters != 1:
-                sort_fn_key = MethodInvocation(self.sort_key).to_lambda(
-                    [self.sort_key.call_args[0]], name=SORT_KEY_METHOD_NAME
-                )
-            else:
-                sort_fn_key = ast.Attribute(
-                    value=ast.Name(id=CLASS_ARG_NAME, ctx=ast.Load()),
-                    attr=SORT_KEY_METHOD_NAME,
-                    ctx=ast.Load(),
-                )
+            sort_fn_key = MethodInvocation(self.sort_key).to_callable(
+                [self.sort_key.call_args[0]], name=SORT_KEY_METHOD_NAME
+            )
 
             if self.cls.reverse_sort:
-                sort_fn = ast.Name(id="nlargest", ctx=ast.Load())
+                sort_fn = load_name("nlargest")
                 additional_globals["nlargest"] = nlargest
             else:
-                sort_fn = ast.Name(id="nsmallest", ctx=ast.Load())
+                sort_fn = load_name("nsmallest")
                 additional_globals["nsmallest"] = nsmallest
 
             get_elements = ast.Call(
                 func=sort_fn,
-                args=[ast.Name(id=K_ARG_NAME, ctx=ast.Load()), get_elements],
+                args=[K_ARG_LOAD, get_elements],
                 keywords=[ast.keyword(arg="key", value=sort_fn_key)],
             )
 
         if self.has_sort_cmp:
-            if self.sort_cmp.num_call_parameters != 2:
-                sort_fn_key = MethodInvocation(self.sort_cmp).to_lambda(
-                    self.sort_cmp.call_args[:2], name=SORT_CMP_METHOD_NAME
-                )
-            else:
-                sort_fn_key = ast.Attribute(
-                    value=ast.Name(id=CLASS_ARG_NAME, ctx=ast.Load()),
-                    attr=SORT_CMP_METHOD_NAME,
-                    ctx=ast.Load(),
-                )
+            sort_fn_key = MethodInvocation(self.sort_cmp).to_callable(
+                self.sort_cmp.call_args[:2], name=SORT_CMP_METHOD_NAME
+            )
 
             if self.cls.reverse_sort:
-                sort_fn = ast.Name(id="nlargest", ctx=ast.Load())
+                sort_fn = load_name("nlargest")
                 additional_globals["nlargest"] = nlargest
             else:
-                sort_fn = ast.Name(id="nsmallest", ctx=ast.Load())
+                sort_fn = load_name("nsmallest")
                 additional_globals["nsmallest"] = nsmallest
 
             get_elements = ast.Call(
                 func=sort_fn,
-                args=[ast.Name(id=K_ARG_NAME, ctx=ast.Load()), get_elements],
+                args=[K_ARG_LOAD, get_elements],
                 keywords=[
                     ast.keyword(
                         arg="key",
                         value=ast.Call(
-                            func=ast.Name(id="cmp_to_key", ctx=ast.Load()),
+                            func=load_name("cmp_to_key"),
                             args=[sort_fn_key],
                             keywords=[],
                         ),
@@ -163,14 +145,14 @@ class DoKImplementation(BaseControllerImplementation):
 
         if not self.has_sort_key and not self.has_sort_cmp:
             get_elements = ast.Call(
-                func=ast.Name(id="islice", ctx=ast.Load()),
-                args=[get_elements, ast.Name(id=K_ARG_NAME, ctx=ast.Load())],
+                func=load_name("islice"),
+                args=[get_elements, K_ARG_LOAD],
                 keywords=[],
             )
             additional_globals["islice"] = islice
             if not self.has_action:
                 get_elements = ast.Call(
-                    func=ast.Name(id="list", ctx=ast.Load()),
+                    func=load_name("list"),
                     args=[get_elements],
                     keywords=[],
                 )
@@ -181,24 +163,15 @@ class DoKImplementation(BaseControllerImplementation):
 
             if self.action.returns_a_value:
                 # we should capture the results using map
-                if self.action.num_call_parameters != 1:
-                    # action has additional parameters, use a lambda
-                    action_fn = action_invoke.to_lambda(
-                        [action_args[0].id], name=ACTION_METHOD_NAME
-                    )
-                else:
-                    # action only takes the required chosen parameter
-                    action_fn = ast.Attribute(
-                        value=ast.Name(id=CLASS_ARG_NAME, ctx=ast.Load()),
-                        attr=ACTION_METHOD_NAME,
-                        ctx=ast.Load(),
-                    )
+                action_fn = action_invoke.to_callable(
+                    [action_args[0].id], name=ACTION_METHOD_NAME
+                )
 
                 action_call = ast.Call(
-                    func=ast.Name(id="list", ctx=ast.Load()),
+                    func=load_name("list"),
                     args=[
                         ast.Call(
-                            func=ast.Name(id="map", ctx=ast.Load()),
+                            func=load_name("map"),
                             args=[action_fn, get_elements],
                             keywords=[],
                         )
@@ -206,21 +179,22 @@ class DoKImplementation(BaseControllerImplementation):
                     keywords=[],
                 )
                 action = ast.Assign(
-                    targets=[
-                        ast.Name(id=ACTION_RESULT_ASSIGNMENT_NAME, ctx=ast.Store())
-                    ],
+                    targets=[ast.Name(id=ACTION_RESULT_ASSIGNMENT_NAME, ctx=STORE)],
                     value=action_call,
                 )
 
             else:
                 # no need to capture the result from the action, so use a basic for loop
+                action_fn = self.bind_method(
+                    body, ACTION_METHOD_NAME, ACTION_LOCAL_NAME
+                )
                 action = ast.For(
-                    target=ast.Name(id=action_args[0].id, ctx=ast.Store()),
+                    target=ast.Name(id=action_args[0].id, ctx=STORE),
                     iter=get_elements,
                     body=[
                         ast.Expr(
                             value=action_invoke.to_function_call(
-                                action_args, action_keywords, name=ACTION_METHOD_NAME
+                                action_args, action_keywords, func=action_fn
                             )
                         )
                     ],
@@ -235,14 +209,12 @@ class DoKImplementation(BaseControllerImplementation):
             fold_args.pop(0)
 
             if self.has_action:
-                fold_args.insert(
-                    0, ast.Name(id=ACTION_RESULT_ASSIGNMENT_NAME, ctx=ast.Load())
-                )
+                fold_args.insert(0, ACTION_RESULT_LOAD)
             else:
                 fold_args.insert(0, get_elements)
 
             fold_assignment = ast.Assign(
-                targets=[ast.Name(id=ACTION_RESULT_ASSIGNMENT_NAME, ctx=ast.Store())],
+                targets=[ast.Name(id=ACTION_RESULT_ASSIGNMENT_NAME, ctx=STORE)],
                 value=fold_invoke.to_function_call(
                     fold_args, fold_keywords, name=FOLD_METHOD_NAME
                 ),
@@ -252,7 +224,7 @@ class DoKImplementation(BaseControllerImplementation):
         elif not self.has_action:
             # does not have an action, return whatever is get_elements
             get_elements_result = ast.Assign(
-                targets=[ast.Name(id=ACTION_RESULT_ASSIGNMENT_NAME, ctx=ast.Store())],
+                targets=[ast.Name(id=ACTION_RESULT_ASSIGNMENT_NAME, ctx=STORE)],
                 value=get_elements,
             )
             body.append(get_elements_result)
@@ -266,25 +238,13 @@ class DoKImplementation(BaseControllerImplementation):
         if not self.has_fold and (self.has_action and not self.action.returns_a_value):
             pass  # do nothing since we explicitly do not need a return value here
         else:
-            body.append(
-                ast.Return(
-                    value=ast.Name(id=ACTION_RESULT_ASSIGNMENT_NAME, ctx=ast.Load())
-                )
-            )
+            body.append(ast.Return(value=ACTION_RESULT_LOAD))
 
-        args, saved_defaults = self.get_call_args(
+        return body, additional_globals
+
+    def generate_call_args(self) -> Tuple[ast.arguments, dict]:
+        return self.get_call_args(
             use_class_arg=True,
             use_k_arg=True,
             use_partition_arg=True,
         )
-        additional_globals.update(saved_defaults)
-        call_fn = ast.FunctionDef(
-            name=GENERATED_CALL_METHOD_NAME,
-            args=args,
-            body=body,
-            decorator_list=[],
-            type_params=[],
-        )
-
-        module = ast.fix_missing_locations(ast.Module(body=[call_fn], type_ignores=[]))
-        return self.compile_call_method(module, additional_globals)
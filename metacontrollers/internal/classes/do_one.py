@@ -1,33 +1,43 @@
 import ast
 import warnings
 from functools import cmp_to_key
-from heapq import nlargest, nsmallest
-from itertools import islice
-from typing import Any, Callable
-
+from typing import List, Tuple
+
+from metacontrollers.internal.ast_nodes import (
+    ACTION_RESULT_LOAD,
+    CHOSEN_ARG_LOAD,
+    NO_CHOSEN_LOAD,
+    PARTITION_ARG_LOAD,
+    STORE,
+    load_name,
+)
 from metacontrollers.internal.exceptions import InvalidControllerMethodError
 from metacontrollers.internal.method_invocation import MethodInvocation
 from metacontrollers.internal.namespace import (
     ACTION_METHOD_NAME,
     ACTION_RESULT_ASSIGNMENT_NAME,
     CHOSEN_ARG_NAME,
-    CLASS_ARG_NAME,
     FILTER_METHOD_NAME,
     FOLD_METHOD_NAME,
-    GENERATED_CALL_METHOD_NAME,
-    PARTITION_ARG_NAME,
+    ITER_FN_NAME,
+    NEXT_FN_NAME,
+    NO_CHOSEN_NAME,
     POST_CONTROLLER_METHOD_NAME,
     PRE_CONTROLLER_METHOD_NAME,
+    SELECT_FN_NAME,
     SORT_CMP_METHOD_NAME,
     SORT_KEY_METHOD_NAME,
 )
 
 from ._base import BaseControllerImplementation
 
+# returned in place of the chosen element when the partition has nothing to choose
+_NO_CHOSEN = object()
+
 
 class DoOneImplementation(BaseControllerImplementation):
-    def __init__(self, cls, name, bases, attrs, stack_frame) -> None:
-        super().__init__(cls, name, bases, attrs, stack_frame, fold_enabled=False)
+    def __init__(self, cls, name, bases, attrs) -> None:
+        super().__init__(cls, name, bases, attrs, fold_enabled=False)
 
     def validate(self) -> None:
         super().validate()
@@ -65,10 +75,10 @@ class DoOneImplementation(BaseControllerImplementation):
                     f'"{ACTION_METHOD_NAME}" should be defined with at least 1 non-class argument (chosen), but 0 were given.'
                 )
 
-    def generate_call_method(self) -> Callable[..., Any]:
+    def generate_call_body(self) -> Tuple[List[ast.stmt], dict]:
         body = []
         additional_globals = {}
-        get_elements = ast.Name(id=PARTITION_ARG_NAME, ctx=ast.Load())
+        get_elements = PARTITION_ARG_LOAD
 
         if self.has_pre_controller:
             pre_controller_call = MethodInvocation(
@@ -77,99 +87,67 @@ class DoOneImplementation(BaseControllerImplementation):
             body.append(ast.Expr(value=pre_controller_call))
 
         if self.has_filter:
-            if self.filter.num_call_parameters != 1:
-                filter_fn = MethodInvocation(self.filter).to_lambda(
-                    [self.filter.call_args[0]], name=FILTER_METHOD_NAME
-                )
-            else:
-                filter_fn = ast.Attribute(
-                    value=ast.Name(id=CLASS_ARG_NAME, ctx=ast.Load()),
-                    attr=FILTER_METHOD_NAME,
-                    ctx=ast.Load(),
-                )
-            get_elements = ast.Call(
-                func=ast.Name(id="filter", ctx=ast.Load()),
-                args=[filter_fn, get_elements],
-                keywords=[],
-            )
+            get_elements = self.get_filtered_elements(body, get_elements)
 
         if self.has_sort_key:
-            if self.sort_key.num_call_parameters != 1:
-                sort_fn_key = MethodInvocation(self.sort_key).to_lambda(
-                    [self.sort_key.call_args[0]], name=SORT_KEY_METHOD_NAME
-                )
-            else:
-                sort_fn_key = ast.Attribute(
-                    value=ast.Name(id=CLASS_ARG_NAME, ctx=ast.Load()),
-                    attr=SORT_KEY_METHOD_NAME,
-                    ctx=ast.Load(),
-                )
-
-            if self.cls.reverse_sort:
-                sort_fn = ast.Name(id="nlargest", ctx=ast.Load())
-                additional_globals["nlargest"] = nlargest
-            else:
-                sort_fn = ast.Name(id="nsmallest", ctx=ast.Load())
-                additional_globals["nsmallest"] = nsmallest
+            sort_fn_key = MethodInvocation(self.sort_key).to_callable(
+                [self.sort_key.call_args[0]], name=SORT_KEY_METHOD_NAME
+            )
 
+            # min/max directly rather than nsmallest/nlargest(1, ...), which wrap them
             get_elements = ast.Call(
-                func=sort_fn,
-                args=[ast.Constant(value=1, kind="int"), get_elements],
-                keywords=[ast.keyword(arg="key", value=sort_fn_key)],
+                func=load_name(SELECT_FN_NAME),
+                args=[get_elements],
+                keywords=[
+                    ast.keyword(arg="key", value=sort_fn_key),
+                    ast.keyword(arg="default", value=NO_CHOSEN_LOAD),
+                ],
             )
 
         if self.has_sort_cmp:
-            if self.sort_cmp.num_call_parameters != 2:
-                sort_fn_key = MethodInvocation(self.sort_cmp).to_lambda(
-                    self.sort_cmp.call_args[:2], name=SORT_CMP_METHOD_NAME
-                )
-            else:
-                sort_fn_key = ast.Attribute(
-                    value=ast.Name(id=CLASS_ARG_NAME, ctx=ast.Load()),
-                    attr=SORT_CMP_METHOD_NAME,
-                    ctx=ast.Load(),
-                )
-
-            if self.cls.reverse_sort:
-                sort_fn = ast.Name(id="nlargest", ctx=ast.Load())
-                additional_globals["nlargest"] = nlargest
-            else:
-                sort_fn = ast.Name(id="nsmallest", ctx=ast.Load())
-                additional_globals["nsmallest"] = nsmallest
+            sort_fn_key = MethodInvocation(self.sort_cmp).to_callable(
+                self.sort_cmp.call_args[:2], name=SORT_CMP_METHOD_NAME
+            )
 
             get_elements = ast.Call(
-                func=sort_fn,
-                args=[ast.Constant(value=1, kind="int"), get_elements],
+                func=load_name(SELECT_FN_NAME),
+                args=[get_elements],
                 keywords=[
                     ast.keyword(
                         arg="key",
                         value=ast.Call(
-                            func=ast.Name(id="cmp_to_key", ctx=ast.Load()),
+                            func=load_name("cmp_to_key"),
                             args=[sort_fn_key],
                             keywords=[],
                         ),
-                    )
+                    ),
+                    ast.keyword(arg="default", value=NO_CHOSEN_LOAD),
                 ],
             )
             additional_globals["cmp_to_key"] = cmp_to_key
 
-        if not self.has_sort_key and not self.has_sort_cmp:
-            get_elements = ast.Call(
-                func=ast.Name(id="islice", ctx=ast.Load()),
-                args=[get_elements, ast.Constant(value=1, kind="int")],
-                keywords=[],
-            )
-            additional_globals["islice"] = islice
-
+        # the builtins are bound under reserved names, since the parameters of the
+        # controlled methods become locals of the call method and could hide them
+        if self.has_sort_key or self.has_sort_cmp:
+            additional_globals[SELECT_FN_NAME] = max if self.cls.reverse_sort else min
+        else:
             get_elements = ast.Call(
-                func=ast.Name(id="list", ctx=ast.Load()),
-                args=[get_elements],
+                func=load_name(NEXT_FN_NAME),
+                args=[
+                    ast.Call(
+                        func=load_name(ITER_FN_NAME), args=[get_elements], keywords=[]
+                    ),
+                    NO_CHOSEN_LOAD,
+                ],
                 keywords=[],
             )
+            additional_globals[NEXT_FN_NAME] = next
+            additional_globals[ITER_FN_NAME] = iter
 
-        # get the chosen element
+        # get the chosen element, or the no chosen sentinel if there is none
+        additional_globals[NO_CHOSEN_NAME] = _NO_CHOSEN
         chosen_element = ast.Assign(
-            targets=[ast.Name(id=CHOSEN_ARG_NAME, ctx=ast.Store())], value=get_elements
+            targets=[ast.Name(id=CHOSEN_ARG_NAME, ctx=STORE)], value=get_elements
         )
         body.append(chosen_element)
 
@@ -177,49 +155,34 @@ class DoOneImplementation(BaseControllerImplementation):
             action_invoke = MethodInvocation(self.action)
             action_args, action_keywords = action_invoke.get_call_args_and_keywords()
 
-            # remove the original argument and replace it with the index 0 of the get_elements statement
+            # remove the original argument and replace it with the chosen element
             action_args.pop(0)
-            action_args.insert(
-                0,
-                ast.Subscript(
-                    value=ast.Name(id=CHOSEN_ARG_NAME, ctx=ast.Load()),
-                    slice=ast.Index(value=ast.Constant(value=0)),
-                    ctx=ast.Load(),
-                ),
-            )
+            action_args.insert(0, CHOSEN_ARG_LOAD)
             action_result = ast.Assign(
-                targets=[ast.Name(id=ACTION_RESULT_ASSIGNMENT_NAME, ctx=ast.Store())],
+                targets=[ast.Name(id=ACTION_RESULT_ASSIGNMENT_NAME, ctx=STORE)],
                 value=MethodInvocation(self.action).to_function_call(
                     action_args, action_keywords, name=ACTION_METHOD_NAME
                 ),
             )
         else:
             action_result = ast.Assign(
-                targets=[ast.Name(id=ACTION_RESULT_ASSIGNMENT_NAME, ctx=ast.Store())],
-                value=ast.Subscript(
-                    value=ast.Name(id=CHOSEN_ARG_NAME, ctx=ast.Load()),
-                    slice=ast.Index(value=ast.Constant(value=0)),
-                    ctx=ast.Load(),
-                ),
+                targets=[ast.Name(id=ACTION_RESULT_ASSIGNMENT_NAME, ctx=STORE)],
+                value=CHOSEN_ARG_LOAD,
             )
 
         # check if there is an element that we should act on
         if_check = ast.If(
             test=ast.Compare(
-                left=ast.Call(
-                    func=ast.Name(id="len", ctx=ast.Load()),
-                    args=[ast.Name(id=CHOSEN_ARG_NAME, ctx=ast.Load())],
-                    keywords=[],
-                ),
-                ops=[ast.NotEq()],
-                comparators=[ast.Constant(value=0, kind="int")],
+                left=CHOSEN_ARG_LOAD,
+                ops=[ast.IsNot()],
+                comparators=[NO_CHOSEN_LOAD],
             ),
             body=[action_result],
             orelse=[],
         )
 
         result = ast.Assign(
-            targets=[ast.Name(id=ACTION_RESULT_ASSIGNMENT_NAME, ctx=ast.Store())],
+            targets=[ast.Name(id=ACTION_RESULT_ASSIGNMENT_NAME, ctx=STORE)],
             value=ast.Constant(value=None, kind=None),
         )
         body.append(result)
@@ -232,32 +195,15 @@ class DoOneImplementation(BaseControllerImplementation):
             body.append(ast.Expr(value=post_controller_call))
 
         if self.has_action:
-            body.append(
-                ast.Return(
-                    value=ast.Name(id=ACTION_RESULT_ASSIGNMENT_NAME, ctx=ast.Load())
-                )
-            )
+            body.append(ast.Return(value=ACTION_RESULT_LOAD))
         else:
-            body.append(
-                ast.Return(
-                    value=ast.Name(id=ACTION_RESULT_ASSIGNMENT_NAME, ctx=ast.Load())
-                )
-            )
+            body.append(ast.Return(value=ACTION_RESULT_LOAD))
 
-        args, saved_defaults = self.get_call_args(
+        return body, additional_globals
+
+    def generate_call_args(self) -> Tuple[ast.arguments, dict]:
+        return self.get_call_args(
             use_class_arg=True,
             use_k_arg=False,
             use_partition_arg=True,
         )
-
-        additional_globals.update(saved_defaults)
-        call_fn = ast.FunctionDef(
-            name=GENERATED_CALL_METHOD_NAME,
-            args=args,
-            body=body,
-            decorator_list=[],
-            type_params=[],
-        )
-
-        module = ast.fix_missing_locations(ast.Module(body=[call_fn], type_ignores=[]))
-        return self.compile_call_method(module, additional_globals)
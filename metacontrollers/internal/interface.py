@@ -1,4 +1,3 @@
-import inspect
 from typing import Any, Generic, Iterable, List, Protocol, TypeVar, Union, _ProtocolMeta
 
 from .classes.do import DoImplementation
@@ -19,32 +18,24 @@ class SupportsRichComparison(Protocol):
     def __gt__(self, other: TSupportsRichComparison) -> bool: ...
 
 
+_BASE_CLASS_NAMES = frozenset(("Do", "DoOne", "DoK", "DoAll"))
+
+
 class MetaController(_ProtocolMeta):
 
     def __init__(cls, name, bases, attrs):
         super().__init__(name, bases, attrs)
-        if name in ["Do", "DoOne", "DoK", "DoAll"]:
+        if name in _BASE_CLASS_NAMES:
             return
 
-        _base_classes = [base for base in bases if base in [Do, DoOne, DoK, DoAll]]
-        if len(_base_classes) > 1:
+        _implementations = [
+            _IMPLEMENTATIONS[base] for base in bases if base in _IMPLEMENTATIONS
+        ]
+        if len(_implementations) > 1:
             raise TypeError("Controller multiple inheritance is not allowed.")
-        _base_class = _base_classes[0]
-
-        if _base_class is Do:
-            implementation = DoImplementation
-        elif _base_class is DoOne:
-            implementation = DoOneImplementation
-        elif _base_class is DoK:
-            implementation = DoKImplementation
-        elif _base_class is DoAll:
-            implementation = DoAllImplementation
-        else:
-            raise NotImplementedError("Unkown base class.")  # should not get here
-
-        controller = implementation(
-            cls, name, bases, attrs, inspect.currentframe().f_back
-        )
+        implementation = _implementations[0]
+
+        controller = implementation(cls, name, bases, attrs)
         controller.validate()
         cls.__call__ = controller.generate_call_method()
 
@@ -186,6 +177,7 @@ class DoK(Generic[TChosen, TActionReturn, TFoldReturn], metaclass=MetaController
 class DoAll(Generic[TChosen, TActionReturn, TFoldReturn], metaclass=MetaController):
     optimize: bool = False
     reverse_sort: bool = False
+    lazy: bool = False
 
     ###
     # Valid User Defined Methods:
@@ -227,6 +219,13 @@ class DoAll(Generic[TChosen, TActionReturn, TFoldReturn], metaclass=MetaControll
             returned from all the calls to the action(...) method. If fold(...) is defined,
             this will return the result from the fold(...) method. Else, this will return
             None.
+
+            When lazy is True and neither fold(...) nor post_controller(...) is defined,
+            the results of an action(...) that returns a value are returned as an
+            iterator instead of a list, and the action(...) is only called as that
+            iterator is consumed. Without an action(...) or a sort, the filtered elements
+            are returned as an iterator in the same way. A sorted result is still a list,
+            and an action(...) that returns nothing still returns None.
         """
         ...
 
@@ -237,3 +236,12 @@ class DoAll(Generic[TChosen, TActionReturn, TFoldReturn], metaclass=MetaControll
             "DoOne[TChosen, TActionReturn, TFoldReturn]",
         ],
     ) -> None: ...
+
+
+# controller base class -> implementation that generates its call method
+_IMPLEMENTATIONS = {
+    Do: DoImplementation,
+    DoOne: DoOneImplementation,
+    DoK: DoKImplementation,
+    DoAll: DoAllImplementation,
+}
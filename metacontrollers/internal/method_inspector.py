@@ -1,8 +1,131 @@
 import ast
+import dis
 import inspect
 import warnings
 from textwrap import dedent
-from typing import Any, Callable, List, Tuple
+from typing import Any, Callable, ItemsView, List, NamedTuple, Optional, Tuple
+from weakref import WeakKeyDictionary
+
+# callable -> (defaults, keyword only defaults, full arg spec, signature dict)
+_SIGNATURE_CACHE: WeakKeyDictionary = WeakKeyDictionary()
+
+# code flags whose return semantics are only resolved from the source
+_GENERATOR_FLAGS = (
+    inspect.CO_GENERATOR
+    | inspect.CO_COROUTINE
+    | inspect.CO_ASYNC_GENERATOR
+    | inspect.CO_ITERABLE_COROUTINE
+)
+
+# instructions that can only leave a user computed value for the RETURN_VALUE after them
+_VALUE_OPNAMES = frozenset(
+    (
+        "LOAD_FAST",
+        "LOAD_DEREF",
+        "LOAD_GLOBAL",
+        "LOAD_NAME",
+        "LOAD_ATTR",
+        "COMPARE_OP",
+        "CONTAINS_OP",
+        "IS_OP",
+        "FORMAT_VALUE",
+        "FORMAT_SIMPLE",
+        "FORMAT_WITH_SPEC",
+    )
+)
+# BINARY_OP (3.11+) and the per-operator BINARY_* / INPLACE_* opcodes of older versions
+_VALUE_OPNAME_PREFIXES = ("BINARY_", "INPLACE_", "BUILD_", "CALL", "UNARY_")
+
+
+def _bytecode_returns_value(fn: Callable) -> bool:
+    """
+    Scans the bytecode of fn for a return statement that returns something other than
+    None. A False result is inconclusive: "return" and "return None" compile to the
+    same instructions, and returns nested in loops or with blocks are preceded by
+    stack cleanup, so those cases must still be resolved from the source.
+
+    Args:
+        fn (Callable): callable to scan
+
+    Returns:
+        bool: True if fn definitely returns a value
+    """
+    code = getattr(inspect.unwrap(fn), "__code__", None)
+    if code is None or code.co_flags & _GENERATOR_FLAGS:
+        return False
+
+    previous = None
+    for instruction in dis.get_instructions(code):
+        opname = instruction.opname
+        if opname == "RETURN_CONST":
+            if instruction.argval is not None:
+                return True
+        elif opname == "RETURN_VALUE" and previous is not None:
+            if previous.opname == "LOAD_CONST":
+                if previous.argval is not None:
+                    return True
+            elif previous.opname in _VALUE_OPNAMES or previous.opname.startswith(
+                _VALUE_OPNAME_PREFIXES
+            ):
+                return True
+        previous = instruction
+    return False
+
+
+class _ReturnOptions(NamedTuple):
+    has_explicit_void_return: bool
+    has_explicit_value_return: bool
+    has_value_yield: bool
+    has_value_yield_from: bool
+    has_parse_error: bool
+
+
+class _ReturnVisitor:
+    """
+    Collects the ways the visited function can exit. Nodes are dispatched on their type
+    through a lookup table, and nested function, lambda and class scopes are never
+    entered since any return or yield in them does not belong to the visited function.
+    """
+
+    def __init__(self) -> None:
+        self.has_explicit_void_return = False
+        self.has_explicit_value_return = False
+        self.has_value_yield = False
+        self.has_value_yield_from = False
+        self._dispatch = {
+            ast.Return: self._on_return,
+            ast.Yield: self._on_yield,
+            ast.YieldFrom: self._on_yield_from,
+            ast.FunctionDef: self._skip,
+            ast.AsyncFunctionDef: self._skip,
+            ast.Lambda: self._skip,
+            ast.ClassDef: self._skip,
+        }
+
+    def generic_visit(self, node: ast.AST) -> None:
+        dispatch = self._dispatch
+        generic_visit = self.generic_visit
+        for child in ast.iter_child_nodes(node):
+            dispatch.get(type(child), generic_visit)(child)
+
+    def _on_return(self, node: ast.Return) -> None:
+        if node.value is not None:
+            self.has_explicit_value_return = True
+            self.generic_visit(node)
+        else:
+            self.has_explicit_void_return = True
+
+    def _on_yield(self, node: ast.Yield) -> None:
+        if node.value is not None:
+            self.has_value_yield = True
+            self.generic_visit(node)
+
+    def _on_yield_from(self, node: ast.YieldFrom) -> None:
+        self.has_value_yield_from = True
+        self.generic_visit(node)
+
+    def _skip(self, node: ast.AST) -> None:
+        pass
 
 
 class MethodInspector:
@@ -33,19 +156,41 @@ class MethodInspector:
         self.__is_staticmethod = isinstance(fn, staticmethod) or static_override
         self.__is_lambda = inspect.isfunction(fn) and fn.__name__ == "<lambda>"
 
-        if hasattr(fn, "__wrapped__"):
-            self.spec = inspect.getfullargspec(fn.__wrapped__)
-            self._signature_dict = self.signature_to_dict(fn.__wrapped__)
-        else:
-            self.spec = inspect.getfullargspec(fn)
-            self._signature_dict = self.signature_to_dict(fn)
+        self.spec, signature_dict = self._get_signature(
+            fn.__wrapped__ if hasattr(fn, "__wrapped__") else fn
+        )
+
+        # signature components, resolved once instead of on every access. The spec may
+        # be shared with other inspectors, so its containers are copied.
+        self.posonlyargs: list = list(signature_dict["posonlyargs"])  # also in args
+        self.args: list = list(self.spec.args)  # position only and keyword args
+        self.varargs: str = self.spec.varargs or None
+        self.varkw: str = self.spec.varkw or None
+        self.defaults: tuple = self.spec.defaults or tuple()
+        self.kwonlyargs: list = list(self.spec.kwonlyargs)
+        self.kwonlydefaults: dict = dict(self.spec.kwonlydefaults or {})
+        self.annotations: dict = dict(self.spec.annotations)
+        self.__defaulted_args = None
+
+        # call args exclude the class arg if this is an instance method
+        self.call_args: list = self.args if self.__is_staticmethod else self.args[1:]
+        self.has_arg_unpack: bool = self.varargs is not None
+        self.has_kwarg_unpack: bool = self.varkw is not None
+        self.num_parameters: int = (
+            len(self.args)
+            + len(self.kwonlyargs)
+            + self.has_arg_unpack
+            + self.has_kwarg_unpack
+        )
+        self.num_call_parameters: int = (
+            self.num_parameters
+            if self.__is_staticmethod
+            else max(self.num_parameters - 1, 0)  # remove the class argument
+        )
 
         # set the placeholder values for the return options
-        self.__has_explicit_void_return = None
-        self.__has_explicit_value_return = None
-        self.__has_value_yield = None
-        self.__has_value_yield_from = None
-        self.__error = None
+        self.__return_options: Optional[_ReturnOptions] = None
+        self.__bytecode_value_return = None
         self.__decompiled_module = None
         self.__source = None
 
@@ -63,29 +208,26 @@ class MethodInspector:
 
     @property
     def has_explicit_void_return(self) -> bool:
-        if self.__has_explicit_void_return is None:
-            self._parse_return_options()
-        return self.__has_explicit_void_return
+        return self._ensure_parsed().has_explicit_void_return
 
     @property
     def has_explicit_value_return(self) -> bool:
-        if self.__has_explicit_value_return is None:
-            self._parse_return_options()
         if self.is_lambda:
             return True  # lambdas always return a value
-        return self.__has_explicit_value_return
+        if self.__return_options is None:
+            if self.__bytecode_value_return is None:
+                self.__bytecode_value_return = _bytecode_returns_value(self.fn)
+            if self.__bytecode_value_return:
+                return True  # no need to parse the source
+        return self._ensure_parsed().has_explicit_value_return
 
     @property
     def has_value_yield(self) -> bool:
-        if self.__has_value_yield is None:
-            self._parse_return_options()
-        return self.__has_value_yield
+        return self._ensure_parsed().has_value_yield
 
     @property
     def has_value_yield_from(self) -> bool:
-        if self.__has_value_yield_from is None:
-            self._parse_return_options()
-        return self.__has_value_yield_from
+        return self._ensure_parsed().has_value_yield_from
 
     @property
     def returns_a_value(self) -> bool:
@@ -97,89 +239,12 @@ class MethodInspector:
 
     @property
     def has_parse_error(self) -> bool:
-        if self.__error is None:
-            self._parse_return_options()
-        return self.__error
+        return self._ensure_parsed().has_parse_error
 
     @property
     def name(self) -> str:
         return self.fn.__name__
 
-    @property
-    def posonlyargs(self) -> list:
-        """
-        Only the position only arguments in the args list.
-        """
-        return self._signature_dict["posonlyargs"]
-
-    @property
-    def args(self) -> list:
-        """
-        Args are made up of position only and keyword arguments.
-        """
-        return self._signature_dict["args"] or list()
-
-    @property
-    def call_args(self) -> list:
-        """
-        Call args are made up of arguments excluding the class arg if
-        this is an instance method.
-
-        Returns:
-            list: _description_
-        """
-        if self.is_staticmethod:
-            return self.args
-        return self.args[1:]
-
-    @property
-    def num_parameters(self) -> int:
-        counter = 0
-        counter += len(self.args)
-        counter += len(self.kwonlyargs)
-        counter += 1 if self.varargs is not None else 0
-        counter += 1 if self.varkw is not None else 0
-        return counter
-
-    @property
-    def num_call_parameters(self) -> int:
-        counter = self.num_parameters
-        if not self.is_staticmethod:
-            counter = max(counter - 1, 0)  # remove the class argument
-        return counter
-
-    @property
-    def varargs(self) -> str:
-        return self._signature_dict["varargs"] or None
-
-    @property
-    def varkw(self) -> str:
-        return self._signature_dict["varkw"] or None
-
-    @property
-    def defaults(self) -> list:
-        return self._signature_dict["defaults"] or list()
-
-    @property
-    def kwonlyargs(self) -> list:
-        return self._signature_dict["kwonlyargs"] or list()
-
-    @property
-    def kwonlydefaults(self) -> list:
-        return self._signature_dict["kwonlydefaults"] or list()
-
-    @property
-    def annotations(self) -> list:
-        return self._signature_dict["annotations"] or list()
-
-    @property
-    def has_arg_unpack(self):
-        return self.varargs is not None
-
-    @property
-    def has_kwarg_unpack(self):
-        return self.varkw is not None
-
     @property
     def full_call_arg_spec(self) -> inspect.FullArgSpec:
         if self.__is_staticmethod:
@@ -222,23 +287,30 @@ class MethodInspector:
         Returns:
             List[Tuple[str, Any]]: defaulted argument names and values
         """
-        keywords = self.args[len(self.args) - len(self.defaults) :]
-        if len(keywords) == 0:
-            return list()
+        if self.__defaulted_args is None:
+            keywords = self.args[len(self.args) - len(self.defaults) :]
+            self.__defaulted_args = list(zip(keywords, self.defaults))
+        return self.__defaulted_args
 
-        return list(zip(keywords, self.defaults))
-
-    def get_keyword_only_args(self) -> List[Tuple[str, Any]]:
+    def get_keyword_only_args(self) -> ItemsView[str, Any]:
         """
-        Returns a list of tuples of (str,Any) being the keyword and its value.
+        Returns a view of (str,Any) tuples being the keyword and its value.
 
         Returns:
-            List[Tuple]: keyword only argument names and values
+            ItemsView[str, Any]: keyword only argument names and values
+        """
+        return self.kwonlydefaults.items()
+
+    def get_non_defaulted_keyword_only_args(self) -> List[str]:
         """
-        if len(self.kwonlyargs) == 0:
-            return list()
+        Returns the list of keyword only arguments that have no default value.
 
-        return list(self.kwonlydefaults.items())
+        Returns:
+            List[str]: required keyword only arguments.
+        """
+        return [
+            keyword for keyword in self.kwonlyargs if keyword not in self.kwonlydefaults
+        ]
 
     def get_non_defaulted_args(self) -> List[str]:
         """
@@ -248,9 +320,17 @@ class MethodInspector:
         Returns:
             List[str]: Position only or non-defaulted arguments.
         """
-        return self.args[: -len(self.get_defaulted_args()) or None]
+        return self.args[: len(self.args) - len(self.defaults)]
 
-    def _parse_return_options(self) -> None:
+    def _ensure_parsed(self) -> _ReturnOptions:
+        """
+        Returns the return options of this instances' callable, parsing them on first use.
+        """
+        if self.__return_options is None:
+            self.__return_options = self._parse_return_options()
+        return self.__return_options
+
+    def _parse_return_options(self) -> _ReturnOptions:
         """Inspection method to parse this instances' callable and determine the
         different ways it can exit:
 
@@ -262,98 +342,26 @@ class MethodInspector:
 
         Value Yield and Value Yield From are equivalent to the checks above, but for
         the yield and yield from keywords.
-        """
-        # pre-set the values
-        self.__has_explicit_void_return = False
-        self.__has_explicit_value_return = False
-        self.__has_value_yield = False
-        self.__has_value_yield_from = False
-        self.__error = False
 
+        Returns:
+            _ReturnOptions: the ways the callable can exit, all False on a parse error
+        """
         try:
             self.__source = inspect.getsource(self.fn)
             self.__decompiled_module = ast.parse(dedent(self.__source))
 
-            class InnerReturnVisitor(ast.NodeVisitor):
-                def __init__(self):
-                    self.has_explicit_void_return = False
-                    self.has_explicit_value_return = False
-                    self.has_value_yield = False
-                    self.has_value_yield_from = False
-                    self.__func_hit = False
-                    self.__parent_map = {}
-
-                def visit(self, node):
-                    if isinstance(node, list):
-                        for item in node:
-                            if isinstance(item, ast.AST):
-                                self.__parent_map[item] = node
-                                super().visit(item)
-                    elif isinstance(node, ast.AST):
-                        for child in ast.iter_child_nodes(node):
-                            self.__parent_map[child] = node
-                        super().visit(node)
-
-                def visit_Return(self, node):
-                    if node.value is not None:
-                        self.has_explicit_value_return = True
-                    else:
-                        self.has_explicit_void_return = True
-
-                def visit_Yield(self, node: ast.Yield):
-                    if node.value is not None:
-                        self.has_value_yield = True
-
-                def visit_YieldFrom(self, node: ast.YieldFrom):
-                    if node.value is not None:
-                        self.has_value_yield_from = True
-
-                def visit_FunctionDef(self, node):
-                    if self.__func_hit == False:
-                        self.__func_hit = True
-                        self.generic_visit(node)
-                    else:
-                        next_node = self.get_next_node(node)
-                        if next_node is not None:
-                            self.visit(next_node)
-
-                def visit_AsyncFunctionDef(self, node):
-                    next_node = self.get_next_node(node)
-                    if next_node is not None:
-                        self.visit(next_node)
-
-                def visit_Lambda(self, node):
-                    next_node = self.get_next_node(node)
-                    if next_node is not None:
-                        self.visit(next_node)
-
-                def visit_ClassDef(self, node: ast.ClassDef):
-                    next_node = self.get_next_node(node)
-                    if next_node is not None:
-                        self.visit(next_node)
-
-                def get_next_node(self, node):
-                    parent = self.__parent_map[node]
-                    if hasattr(parent, "body"):
-                        next_sibling = (
-                            parent.body[parent.body.index(node) + 1]
-                            if parent.body.index(node) + 1 < len(parent.body)
-                            else None
-                        )
-                    else:
-                        next_sibling = None
-                    return next_sibling
-
-            visitor = InnerReturnVisitor()
-            visitor.visit(
+            visitor = _ReturnVisitor()
+            visitor.generic_visit(
                 self.__decompiled_module.body[0]
             )  # Only visit the top-level function
 
-            self.__has_explicit_value_return = visitor.has_explicit_value_return
-            self.__has_explicit_void_return = visitor.has_explicit_void_return
-            self.__has_value_yield = visitor.has_value_yield
-            self.__has_value_yield_from = visitor.has_value_yield_from
-            self.__error = False
+            return _ReturnOptions(
+                has_explicit_void_return=visitor.has_explicit_void_return,
+                has_explicit_value_return=visitor.has_explicit_value_return,
+                has_value_yield=visitor.has_value_yield,
+                has_value_yield_from=visitor.has_value_yield_from,
+                has_parse_error=False,
+            )
 
         except BaseException as err:
             try:
@@ -361,10 +369,54 @@ class MethodInspector:
             except BaseException:
                 name = "UNKNOWN"
             warnings.warn(f'Unable to parse callable "{name}". Error message: {err}')
-            self.__error = True
+            return _ReturnOptions(False, False, False, False, True)
 
     @staticmethod
-    def signature_to_dict(fn: Callable) -> dict:
+    def _get_signature(fn: Callable) -> Tuple[inspect.FullArgSpec, dict]:
+        """
+        Returns the full arg spec and signature dict of the callable, reusing the
+        results of previous inspections of the same callable when possible. Cached
+        results are discarded once the defaults of the callable are reassigned.
+        """
+        defaults = getattr(fn, "__defaults__", None)
+        kwdefaults = getattr(fn, "__kwdefaults__", None)
+        try:
+            cached = _SIGNATURE_CACHE.get(fn)
+        except TypeError:
+            cached = None  # not hashable or weak referenceable; nothing to reuse
+        if (
+            cached is not None
+            and cached[0] is defaults
+            and MethodInspector._same_kwdefaults(cached[1], kwdefaults)
+        ):
+            return cached[2], cached[3]
+
+        spec = inspect.getfullargspec(fn)
+        result = (spec, MethodInspector.signature_to_dict(fn, spec))
+        try:
+            _SIGNATURE_CACHE[fn] = (
+                defaults,
+                None if kwdefaults is None else dict(kwdefaults),
+                *result,
+            )
+        except TypeError:
+            pass
+        return result
+
+    @staticmethod
+    def _same_kwdefaults(cached: Optional[dict], current: Optional[dict]) -> bool:
+        """
+        Returns True if the keyword only defaults hold the same objects as the copy
+        cached with the signature.
+        """
+        if cached is None or current is None:
+            return cached is current
+        return cached.keys() == current.keys() and all(
+            cached[key] is value for key, value in current.items()
+        )
+
+    @staticmethod
+    def signature_to_dict(fn: Callable, spec: inspect.FullArgSpec = None) -> dict:
         """
         returns a dict with the following keys:
         'posonlyargs', 'args', 'varargs', 'varkw', 'defaults', 'kwonlyargs', 'kwonlydefaults', 'annotations'
@@ -373,17 +425,28 @@ class MethodInspector:
 
         Args:
             fn (Callable): callable object
+            spec (inspect.FullArgSpec, optional): full arg spec of fn, if already known. Defaults to None.
 
         Returns:
             dict: dictionary with the components of the call signature
         """
-        result = {}
-        result["posonlyargs"] = [
-            name
-            for name, param in inspect.signature(fn).parameters.items()
-            if param.kind == inspect.Parameter.POSITIONAL_ONLY
-        ]
-        result.update(inspect.getfullargspec(fn)._asdict())
+        if spec is None:
+            spec = inspect.getfullargspec(fn)
+
+        code = getattr(fn, "__code__", None)
+        if code is not None:
+            # bound methods do not report their bound argument as position only
+            start = 1 if inspect.ismethod(fn) else 0
+            posonlyargs = spec.args[start : code.co_posonlyargcount]
+        else:
+            posonlyargs = [
+                name
+                for name, param in inspect.signature(fn).parameters.items()
+                if param.kind == inspect.Parameter.POSITIONAL_ONLY
+            ]
+
+        result = {"posonlyargs": posonlyargs}
+        result.update(spec._asdict())
         return result
 
 
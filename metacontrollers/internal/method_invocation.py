@@ -1,8 +1,8 @@
 import ast
 from typing import List, Tuple
 
+from metacontrollers.internal.ast_nodes import CLASS_ARG_LOAD, LOAD, arg_node, load_name
 from metacontrollers.internal.method_inspector import MethodInspector
-from metacontrollers.internal.namespace import CLASS_ARG_NAME
 
 
 class MethodInvocation:
@@ -17,26 +17,18 @@ class MethodInvocation:
             Tuple[List[ast.AST], List[ast.keyword]]: Tuple of the list of arguments and the list of keywords
             to call this method.
         """
-        args = [ast.Name(id=arg, ctx=ast.Load()) for arg in self.method.call_args]
-        if self.method.has_arg_unpack:
-            args.append(
-                ast.Starred(
-                    value=ast.Name(id=self.method.varargs, ctx=ast.Load()),
-                    ctx=ast.Load(),
-                )
-            )
+        method = self.method
+        args = [load_name(arg) for arg in method.call_args]
+        if method.varargs is not None:
+            args.append(ast.Starred(value=load_name(method.varargs), ctx=LOAD))
 
         keywords = [
-            ast.keyword(arg=keyword, value=ast.Name(id=keyword, ctx=ast.Load()))
-            for keyword, _ in self.method.get_keyword_only_args()
+            ast.keyword(arg=keyword, value=load_name(keyword))
+            for keyword in method.kwonlyargs
         ]
 
-        if self.method.has_kwarg_unpack:
-            keywords.append(
-                ast.keyword(
-                    arg=None, value=ast.Name(id=self.method.varkw, ctx=ast.Load())
-                )
-            )
+        if method.varkw is not None:
+            keywords.append(ast.keyword(arg=None, value=load_name(method.varkw)))
         return args, keywords
 
     def to_function_call(
@@ -44,12 +36,16 @@ class MethodInvocation:
         args: List[ast.AST] = None,
         keywords: List[ast.keyword] = None,
         name: str = None,
+        func: ast.AST = None,
     ) -> ast.Call:
         """
         Generates the invocation call for this method, assuming the arguments
         being passed in are the same name as the parameters defined in this
         function.
 
+        If func is given, it is called instead of the instance attribute (for example
+        a local variable the bound method was assigned to).
+
         Returns:
             ast.Call: ast representation of a Callable that will call this instances method.
             This should be wrapped in an ast.Expr before compiling.
@@ -62,24 +58,18 @@ class MethodInvocation:
             if keywords is None:
                 keywords = __keywords
 
-        if name is None:
-            _name = self.method.name
-        else:
-            _name = name
-        return ast.Call(
-            func=ast.Attribute(
-                value=ast.Name(id=CLASS_ARG_NAME, ctx=ast.Load()),
-                attr=_name,
-                ctx=ast.Load(),
-            ),
-            args=args,
-            keywords=keywords,
-        )
+        if func is None:
+            func = ast.Attribute(
+                value=CLASS_ARG_LOAD,
+                attr=self.method.name if name is None else name,
+                ctx=LOAD,
+            )
+        return ast.Call(func=func, args=args, keywords=keywords)
 
     def to_lambda(self, lambda_args: List[str], name: str = None) -> ast.Lambda:
         args = ast.arguments(
             posonlyargs=[],
-            args=[ast.arg(arg=arg, annotation=None) for arg in lambda_args],
+            args=[arg_node(arg) for arg in lambda_args],
             vararg=None,
             kwonlyargs=[],
             kw_defaults=[],
@@ -87,3 +77,25 @@ class MethodInvocation:
             defaults=[],
         )
         return ast.Lambda(args=args, body=self.to_function_call(name=name))
+
+    def to_callable(self, lambda_args: List[str], name: str = None) -> ast.AST:
+        """
+        Generates a callable that takes lambda_args and calls this method. When this
+        method takes nothing besides lambda_args, the method itself is returned instead
+        of wrapping it in a lambda.
+
+        Args:
+            lambda_args (List[str]): names of the arguments the callable is called with.
+            name (str, optional): attribute name of the method. Defaults to the method name.
+
+        Returns:
+            ast.AST: ast representation of the callable.
+        """
+        if self.method.num_call_parameters != len(lambda_args):
+            # the method has additional parameters, use a lambda
+            return self.to_lambda(lambda_args, name=name)
+        return ast.Attribute(
+            value=CLASS_ARG_LOAD,
+            attr=self.method.name if name is None else name,
+            ctx=LOAD,
+        )
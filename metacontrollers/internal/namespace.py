@@ -23,6 +23,12 @@ GENERATED_CALL_METHOD_NAME = "__ctrl_call__"
 ####
 # Variable Names
 ACTION_RESULT_ASSIGNMENT_NAME = "__ctrl_result__"
+NO_CHOSEN_NAME = "__ctrl_no_chosen__"
+FILTER_LOCAL_NAME = "__ctrl_filter__"
+ACTION_LOCAL_NAME = "__ctrl_action__"
+SELECT_FN_NAME = "__ctrl_select__"
+NEXT_FN_NAME = "__ctrl_next__"
+ITER_FN_NAME = "__ctrl_iter__"
 
 RESERVED_KEYWORDS = {
     CHOSEN_ARG_NAME,
@@ -31,4 +37,10 @@ RESERVED_KEYWORDS = {
     SORT_CMP_ARG_A_NAME,
     SORT_CMP_ARG_B_NAME,
     ACTION_RESULT_ASSIGNMENT_NAME,
+    NO_CHOSEN_NAME,
+    FILTER_LOCAL_NAME,
+    ACTION_LOCAL_NAME,
+    SELECT_FN_NAME,
+    NEXT_FN_NAME,
+    ITER_FN_NAME,
 }
@@ -1,17 +1,21 @@
 import random
-from typing import Any, List
-
-random.seed(0)
-import os
-import sys
-
-sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 import unittest
+from typing import Any, List
 
 from metacontrollers import DoK
 
+rng = random.Random(0)
+
 
 class ArgCheck:
+    __slots__ = (
+        "filter_passed",
+        "sort_cmp_passed",
+        "sort_key_passed",
+        "action_passed",
+        "fold_passed",
+    )
+
     def __init__(self):
         self.filter_passed = False
         self.sort_cmp_passed = False
@@ -21,9 +25,10 @@ class ArgCheck:
 
 
 class TestDoK0MethodCombinationsWithArg(unittest.TestCase):
-    def setUp(test_self):
-        test_self.elements = [random.randint(0, 1000) for _ in range(10)]
-        test_self.k = 0
+    @classmethod
+    def setUpClass(cls):
+        cls.elements = rng.choices(range(1001), k=10)
+        cls.k = 0
 
     def test_filter_sort_cmp(test_self):
         class T(DoK):
@@ -480,9 +485,10 @@ class TestDoK0MethodCombinationsWithArg(unittest.TestCase):
 
 
 class TestDoK1MethodCombinationsWithArg(unittest.TestCase):
-    def setUp(test_self):
-        test_self.elements = [random.randint(0, 1000) for _ in range(10)]
-        test_self.k = 1
+    @classmethod
+    def setUpClass(cls):
+        cls.elements = rng.choices(range(1001), k=10)
+        cls.k = 1
 
     def test_filter_sort_cmp(test_self):
         class T(DoK):
@@ -939,9 +945,10 @@ class TestDoK1MethodCombinationsWithArg(unittest.TestCase):
 
 
 class TestDoK5MethodCombinationsWithArg(unittest.TestCase):
-    def setUp(test_self):
-        test_self.elements = [random.randint(0, 1000) for _ in range(10)]
-        test_self.k = 5
+    @classmethod
+    def setUpClass(cls):
+        cls.elements = rng.choices(range(1001), k=10)
+        cls.k = 5
 
     def test_filter_sort_cmp(test_self):
         class T(DoK):
@@ -1142,9 +1149,9 @@ class TestDoK5MethodCombinationsWithArg(unittest.TestCase):
         arg = ArgCheck()
         inst = T()
         result = inst(test_self.k, test_self.elements, arg)
-        expected_results = sorted(
-            [i + 1 for i in test_self.elements if i % 2 == 0][: test_self.k]
-        )
+        expected_results = sorted([i + 1 for i in test_self.elements if i % 2 == 0])[
+            : test_self.k
+        ]
         test_self.assertListEqual(result, expected_results)
         test_self.assertTrue(arg.filter_passed)
         test_self.assertTrue(arg.sort_cmp_passed)
@@ -1398,9 +1405,10 @@ class TestDoK5MethodCombinationsWithArg(unittest.TestCase):
 
 
 class TestDoKAllMethodCombinationsWithArg(unittest.TestCase):
-    def setUp(test_self):
-        test_self.elements = [random.randint(0, 1000) for _ in range(10)]
-        test_self.k = 10
+    @classmethod
+    def setUpClass(cls):
+        cls.elements = rng.choices(range(1001), k=10)
+        cls.k = 10
 
     def test_filter_sort_cmp(test_self):
         class T(DoK):
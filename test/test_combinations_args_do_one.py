@@ -1,17 +1,21 @@
 import random
-from typing import Any
-
-random.seed(0)
-import os
-import sys
-
-sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 import unittest
+from typing import Any
 
 from metacontrollers import DoOne
 
+rng = random.Random(0)
+
 
 class ArgCheck:
+    __slots__ = (
+        "filter_passed",
+        "sort_cmp_passed",
+        "sort_key_passed",
+        "action_passed",
+        "fold_passed",
+    )
+
     def __init__(
         self,
         filter_passed=False,
@@ -28,8 +32,9 @@ class ArgCheck:
 
 
 class TestDoOneMethodCombinationsWithArg(unittest.TestCase):
-    def setUp(test_self):
-        test_self.elements = [random.randint(0, 1000) for _ in range(10)]
+    @classmethod
+    def setUpClass(cls):
+        cls.elements = rng.choices(range(1001), k=10)
 
     def test_filter_sort_cmp(test_self):
         class T(DoOne):
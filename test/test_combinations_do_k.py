@@ -1,20 +1,17 @@
 import random
-from typing import Any, List
-
-random.seed(0)
-import os
-import sys
-
-sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 import unittest
+from typing import Any, List
 
 from metacontrollers import DoK
 
+rng = random.Random(0)
+
 
 class TestDoK0MethodCombinations(unittest.TestCase):
-    def setUp(test_self):
-        test_self.elements = [random.randint(0, 1000) for _ in range(10)]
-        test_self.k = 0
+    @classmethod
+    def setUpClass(cls):
+        cls.elements = rng.choices(range(1001), k=10)
+        cls.k = 0
 
     def test_filter_sort_cmp(test_self):
         class T(DoK):
@@ -362,9 +359,10 @@ class TestDoK0MethodCombinations(unittest.TestCase):
 
 
 class TestDoK1MethodCombinations(unittest.TestCase):
-    def setUp(test_self):
-        test_self.elements = [random.randint(0, 1000) for _ in range(10)]
-        test_self.k = 1
+    @classmethod
+    def setUpClass(cls):
+        cls.elements = rng.choices(range(1001), k=10)
+        cls.k = 1
 
     def test_filter_sort_cmp(test_self):
         class T(DoK):
@@ -712,9 +710,10 @@ class TestDoK1MethodCombinations(unittest.TestCase):
 
 
 class TestDoK5MethodCombinations(unittest.TestCase):
-    def setUp(test_self):
-        test_self.elements = [random.randint(0, 1000) for _ in range(10)]
-        test_self.k = 5
+    @classmethod
+    def setUpClass(cls):
+        cls.elements = rng.choices(range(1001), k=10)
+        cls.k = 5
 
     def test_filter_sort_cmp(test_self):
         class T(DoK):
@@ -1062,9 +1061,10 @@ class TestDoK5MethodCombinations(unittest.TestCase):
 
 
 class TestDoKAllMethodCombinations(unittest.TestCase):
-    def setUp(test_self):
-        test_self.elements = [random.randint(0, 1000) for _ in range(10)]
-        test_self.k = 10
+    @classmethod
+    def setUpClass(cls):
+        cls.elements = rng.choices(range(1001), k=10)
+        cls.k = 10
 
     def test_filter_sort_cmp(test_self):
         class T(DoK):
@@ -1,11 +1,10 @@
-import os
-import sys
-
-sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 import unittest
 
 from metacontrollers import Do
-from metacontrollers.internal.method_inspector import MethodInspector
+from metacontrollers.internal.method_inspector import (
+    MethodInspector,
+    _bytecode_returns_value,
+)
 
 
 class TestAssignments(unittest.TestCase):
@@ -208,6 +207,33 @@ class TestMethodReturns(unittest.TestCase):
         self.assertFalse(fn.has_value_yield)
         self.assertFalse(fn.has_value_yield_from)
 
+    def test_value_return_without_source(self):
+        namespace = {}
+        exec("def add(x):\n    return x + 1", namespace)
+        exec("def subscript(x):\n    return x[0]", namespace)
+        exec("def negate(x):\n    return -x", namespace)
+
+        for name in ("add", "subscript", "negate"):
+            fn = MethodInspector(namespace[name])
+            self.assertTrue(fn.returns_a_value, name)
+
+    def test_no_return_nested_generator_function(self):
+        def no_return_outer():
+            def inner_generator():
+                yield 1
+                yield from [2, 3]
+
+            async def inner_coroutine():
+                return 4
+
+            inner_generator()
+
+        fn = MethodInspector(no_return_outer)
+        self.assertFalse(fn.has_explicit_value_return)
+        self.assertFalse(fn.has_explicit_void_return)
+        self.assertFalse(fn.has_value_yield)
+        self.assertFalse(fn.has_value_yield_from)
+
     def test_mixed_return(self):
         def mixed_return(x):
             if x > 0:
@@ -313,6 +339,59 @@ class TestMethodReturns(unittest.TestCase):
         self.assertFalse(fn.has_value_yield_from)
 
 
+def _compile_without_source(source: str):
+    namespace = {}
+    exec(source, namespace)
+    return namespace["fn"]
+
+
+class TestBytecodeReturns(unittest.TestCase):
+    def test_value_returns(self):
+        sources = [
+            "def fn(x):\n    return 1",
+            "def fn(x):\n    return x",
+            "def fn(x):\n    return x.y",
+            "def fn(x):\n    return len(x)",
+            "def fn(x):\n    return x + 1",
+            "def fn(x):\n    return x[0]",
+            "def fn(x):\n    return -x",
+            "def fn(x):\n    return not x",
+            "def fn(x):\n    return x < 1",
+            "def fn(x):\n    return x in [1]",
+            "def fn(x):\n    return x is None",
+            "def fn(x):\n    return f'{x}'",
+            "def fn(x):\n    return [x]",
+            "def fn(x):\n    return (x, x)",
+            "def fn(x):\n    return {x: x}",
+            "def fn(x):\n    if x:\n        return\n    return 2",
+            "def fn(x):\n    x += 1\n    return x",
+        ]
+        for source in sources:
+            self.assertTrue(
+                _bytecode_returns_value(_compile_without_source(source)), source
+            )
+
+    def test_inconclusive_returns(self):
+        sources = [
+            "def fn(x):\n    pass",
+            "def fn(x):\n    return",
+            "def fn(x):\n    return None",
+            "def fn(x):\n    x += 1",
+            "def fn(x):\n    yield x",
+            "def fn(x):\n    yield from x\n    return 1",
+            "async def fn(x):\n    return 1",
+        ]
+        for source in sources:
+            self.assertFalse(
+                _bytecode_returns_value(_compile_without_source(source)), source
+            )
+
+    def test_inspector_without_source(self):
+        fn = MethodInspector(_compile_without_source("def fn(x):\n    return x * 2"))
+        self.assertTrue(fn.has_explicit_value_return)
+        self.assertTrue(fn.returns_a_value)
+
+
 class TestFunctionsWithClasses(unittest.TestCase):
 
     def test_function_with_inner_class_return(self):
@@ -479,6 +558,33 @@ class TestMethodInspectorProperties(unittest.TestCase):
     def test_posonlyargs(self):
         self.assertEqual(self.simple_fn.posonlyargs, ["a"])
 
+    def test_unbound_posonlyargs(self):
+        fn = MethodInspector(ArgClass.simple_function)
+        self.assertEqual(fn.posonlyargs, ["self", "a"])
+
+    def test_signature_reused(self):
+        fn = MethodInspector(ArgClass.function_with_annotations)
+        self.assertIs(MethodInspector(ArgClass.function_with_annotations).spec, fn.spec)
+
+    def test_signature_refreshed_after_defaults_change(self):
+        def fn(a, b=1, *, c=2):
+            pass
+
+        MethodInspector(fn)
+        fn.__defaults__ = (10,)
+        fn.__kwdefaults__["c"] = 20
+        inspector = MethodInspector(fn)
+        self.assertEqual(inspector.defaults, (10,))
+        self.assertEqual(inspector.kwonlydefaults, {"c": 20})
+
+    def test_signature_lists_not_shared(self):
+        fn = MethodInspector(ArgClass.function_with_annotations)
+        fn.args.append("extra")
+        fn.call_args.append("extra")
+        other = MethodInspector(ArgClass.function_with_annotations)
+        self.assertNotIn("extra", other.args)
+        self.assertNotIn("extra", other.call_args)
+
     def test_args(self):
         self.assertEqual(self.simple_fn.args, ["self", "a", "b"])
 
@@ -506,6 +612,9 @@ class TestMethodInspectorProperties(unittest.TestCase):
     def test_kwonlydefaults(self):
         self.assertEqual(self.simple_fn.kwonlydefaults, {"d": 20})
 
+    def test_non_defaulted_keyword_only_args(self):
+        self.assertEqual(self.simple_fn.get_non_defaulted_keyword_only_args(), ["c"])
+
     def test_annotations(self):
         self.assertEqual(
             self.annotation_fn.annotations, {"x": int, "y": str, "return": float}
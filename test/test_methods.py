@@ -1,18 +1,19 @@
 import random
-from typing import Any, List
-
-random.seed(0)
-import os
-import sys
-
-sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 import unittest
+from typing import Any, List
 
 from metacontrollers import Do, DoAll, DoK, DoOne
-from metacontrollers.internal.exceptions import InvalidControllerMethodError
+from metacontrollers.internal.exceptions import (
+    ArgumentError,
+    InvalidControllerMethodError,
+)
+
+rng = random.Random(0)
 
 
 class ArgWrapper:
+    __slots__ = ("value",)
+
     def __init__(self, value):
         self.value = value
 
@@ -170,8 +171,11 @@ class TestFilter(unittest.TestCase):
 
 class TestSortKey(unittest.TestCase):
 
-    def setUp(self):
-        self.elements = [random.randint(0, 1000) for _ in range(10)]
+    @classmethod
+    def setUpClass(cls):
+        cls.elements = rng.choices(range(1001), k=10)
+        cls.sorted_elements = sorted(cls.elements)
+        cls.reverse_sorted_elements = sorted(cls.elements, reverse=True)
 
     def test_do(self):
         with self.assertRaises(InvalidControllerMethodError):
@@ -194,9 +198,7 @@ class TestSortKey(unittest.TestCase):
                 return chosen
 
         inst = T()
-        self.assertTrue(
-            inst(3, self.elements) == sorted(self.elements, key=lambda x: x)[:3]
-        )
+        self.assertTrue(inst(3, self.elements) == self.sorted_elements[:3])
 
     def test_do_all(self):
         class T(DoAll):
@@ -204,7 +206,7 @@ class TestSortKey(unittest.TestCase):
                 return chosen
 
         inst = T()
-        self.assertTrue(inst(self.elements) == sorted(self.elements, key=lambda x: x))
+        self.assertTrue(inst(self.elements) == self.sorted_elements)
 
     def test_do_one_static(self):
         class T(DoOne):
@@ -222,9 +224,7 @@ class TestSortKey(unittest.TestCase):
                 return chosen
 
         inst = T()
-        self.assertTrue(
-            inst(3, self.elements) == sorted(self.elements, key=lambda x: x)[:3]
-        )
+        self.assertTrue(inst(3, self.elements) == self.sorted_elements[:3])
 
     def test_do_all_static(self):
         class T(DoAll):
@@ -233,7 +233,7 @@ class TestSortKey(unittest.TestCase):
                 return chosen
 
         inst = T()
-        self.assertTrue(inst(self.elements) == sorted(self.elements, key=lambda x: x))
+        self.assertTrue(inst(self.elements) == self.sorted_elements)
 
     # reverse tests
     def test_do_reverse(self):
@@ -263,10 +263,7 @@ class TestSortKey(unittest.TestCase):
                 return chosen
 
         inst = T()
-        self.assertTrue(
-            inst(3, self.elements)
-            == sorted(self.elements, key=lambda x: x, reverse=True)[:3]
-        )
+        self.assertTrue(inst(3, self.elements) == self.reverse_sorted_elements[:3])
 
     def test_do_all_reverse(self):
         class T(DoAll):
@@ -276,9 +273,7 @@ class TestSortKey(unittest.TestCase):
                 return chosen
 
         inst = T()
-        self.assertTrue(
-            inst(self.elements) == sorted(self.elements, key=lambda x: x, reverse=True)
-        )
+        self.assertTrue(inst(self.elements) == self.reverse_sorted_elements)
 
     def test_do_one_static_reverse(self):
         class T(DoOne):
@@ -300,10 +295,7 @@ class TestSortKey(unittest.TestCase):
                 return chosen
 
         inst = T()
-        self.assertTrue(
-            inst(3, self.elements)
-            == sorted(self.elements, key=lambda x: x, reverse=True)[:3]
-        )
+        self.assertTrue(inst(3, self.elements) == self.reverse_sorted_elements[:3])
 
     def test_do_all_static_reverse(self):
         class T(DoAll):
@@ -314,15 +306,16 @@ class TestSortKey(unittest.TestCase):
                 return chosen
 
         inst = T()
-        self.assertTrue(
-            inst(self.elements) == sorted(self.elements, key=lambda x: x, reverse=True)
-        )
+        self.assertTrue(inst(self.elements) == self.reverse_sorted_elements)
 
 
 class TestSortCmp(unittest.TestCase):
 
-    def setUp(self):
-        self.elements = [random.randint(0, 1000) for _ in range(10)]
+    @classmethod
+    def setUpClass(cls):
+        cls.elements = rng.choices(range(1001), k=10)
+        cls.sorted_elements = sorted(cls.elements)
+        cls.reverse_sorted_elements = sorted(cls.elements, reverse=True)
 
     def test_do(self):
         with self.assertRaises(InvalidControllerMethodError):
@@ -345,9 +338,7 @@ class TestSortCmp(unittest.TestCase):
                 return -1 if a < b else 1 if a > b else 0
 
         inst = T()
-        self.assertTrue(
-            inst(3, self.elements) == sorted(self.elements, key=lambda x: x)[:3]
-        )
+        self.assertTrue(inst(3, self.elements) == self.sorted_elements[:3])
 
     def test_do_all(self):
         class T(DoAll):
@@ -355,7 +346,7 @@ class TestSortCmp(unittest.TestCase):
                 return -1 if a < b else 1 if a > b else 0
 
         inst = T()
-        self.assertTrue(inst(self.elements) == sorted(self.elements, key=lambda x: x))
+        self.assertTrue(inst(self.elements) == self.sorted_elements)
 
     def test_do_one_static(self):
         class T(DoOne):
@@ -373,9 +364,7 @@ class TestSortCmp(unittest.TestCase):
                 return -1 if a < b else 1 if a > b else 0
 
         inst = T()
-        self.assertTrue(
-            inst(3, self.elements) == sorted(self.elements, key=lambda x: x)[:3]
-        )
+        self.assertTrue(inst(3, self.elements) == self.sorted_elements[:3])
 
     def test_do_all_static(self):
         class T(DoAll):
@@ -384,7 +373,7 @@ class TestSortCmp(unittest.TestCase):
                 return -1 if a < b else 1 if a > b else 0
 
         inst = T()
-        self.assertTrue(inst(self.elements) == sorted(self.elements, key=lambda x: x))
+        self.assertTrue(inst(self.elements) == self.sorted_elements)
 
     # reverse tests
     def test_do_reverse(self):
@@ -414,10 +403,7 @@ class TestSortCmp(unittest.TestCase):
                 return -1 if a < b else 1 if a > b else 0
 
         inst = T()
-        self.assertTrue(
-            inst(3, self.elements)
-            == sorted(self.elements, key=lambda x: x, reverse=True)[:3]
-        )
+        self.assertTrue(inst(3, self.elements) == self.reverse_sorted_elements[:3])
 
     def test_do_all_reverse(self):
         class T(DoAll):
@@ -427,9 +413,7 @@ class TestSortCmp(unittest.TestCase):
                 return -1 if a < b else 1 if a > b else 0
 
         inst = T()
-        self.assertTrue(
-            inst(self.elements) == sorted(self.elements, key=lambda x: x, reverse=True)
-        )
+        self.assertTrue(inst(self.elements) == self.reverse_sorted_elements)
 
     def test_do_one_static_reverse(self):
         class T(DoOne):
@@ -451,10 +435,7 @@ class TestSortCmp(unittest.TestCase):
                 return -1 if a < b else 1 if a > b else 0
 
         inst = T()
-        self.assertTrue(
-            inst(3, self.elements)
-            == sorted(self.elements, key=lambda x: x, reverse=True)[:3]
-        )
+        self.assertTrue(inst(3, self.elements) == self.reverse_sorted_elements[:3])
 
     def test_do_all_static_reverse(self):
         class T(DoAll):
@@ -465,14 +446,13 @@ class TestSortCmp(unittest.TestCase):
                 return -1 if a < b else 1 if a > b else 0
 
         inst = T()
-        self.assertTrue(
-            inst(self.elements) == sorted(self.elements, key=lambda x: x, reverse=True)
-        )
+        self.assertTrue(inst(self.elements) == self.reverse_sorted_elements)
 
 
 class TestAction(unittest.TestCase):
-    def setUp(self):
-        self.elements = [random.randint(0, 1000) for _ in range(10)]
+    @classmethod
+    def setUpClass(cls):
+        cls.elements = rng.choices(range(1001), k=10)
 
     def test_do_no_return(self):
         self.passed = False
@@ -739,7 +719,7 @@ class TestFold(unittest.TestCase):
                 return sum(results)
 
         inst = T()
-        elements = [random.randint(0, 1000) for _ in range(10)]
+        elements = rng.choices(range(1001), k=10)
         result = inst(5, elements)
         self.assertTrue(sum(elements[:5]) == result)
 
@@ -749,7 +729,7 @@ class TestFold(unittest.TestCase):
                 return sum(results)
 
         inst = T()
-        elements = [random.randint(0, 1000) for _ in range(10)]
+        elements = rng.choices(range(1001), k=10)
         result = inst(elements)
         self.assertTrue(sum(elements) == result)
 
@@ -777,7 +757,7 @@ class TestFold(unittest.TestCase):
                 return sum(results)
 
         inst = T()
-        elements = [random.randint(0, 1000) for _ in range(10)]
+        elements = rng.choices(range(1001), k=10)
         result = inst(5, elements)
         self.assertTrue(sum(elements[:5]) == result)
 
@@ -788,7 +768,7 @@ class TestFold(unittest.TestCase):
                 return sum(results)
 
         inst = T()
-        elements = [random.randint(0, 1000) for _ in range(10)]
+        elements = rng.choices(range(1001), k=10)
         result = inst(elements)
         self.assertTrue(sum(elements) == result)
 
@@ -884,5 +864,239 @@ class TestPostController(unittest.TestCase):
         self.assertTrue(arg.value)
 
 
+class TestBuiltinParameterNames(unittest.TestCase):
+    def test_sorted_do_one(self):
+        class T(DoOne):
+            def sort_key(self, chosen, min):
+                return abs(chosen - min)
+
+        self.assertTrue(T()([1, 2, 3, 4, 5], 3) == 3)
+
+    def test_reverse_sorted_do_one(self):
+        class T(DoOne):
+            reverse_sort = True
+
+            def sort_key(self, chosen, max):
+                return chosen % max
+
+        class U(DoOne):
+            reverse_sort = True
+
+            def sort_cmp(self, a, b, max):
+                return a - b
+
+        self.assertTrue(T()([1, 2, 3, 4, 5], 3) == 2)
+        self.assertTrue(U()([1, 2, 3, 4, 5], 3) == 5)
+
+    def test_unsorted_do_one(self):
+        class T(DoOne):
+            def filter(self, chosen, next):
+                return chosen > next
+
+        class U(DoOne):
+            def action(self, chosen, iter):
+                return chosen * iter
+
+        self.assertTrue(T()([1, 2, 3, 4, 5], 3) == 4)
+        self.assertTrue(U()([1, 2, 3, 4, 5], 3) == 3)
+
+
+class TestKeywordOnlyArgs(unittest.TestCase):
+    def test_required_keyword_only(self):
+        class T(DoAll):
+            def action(self, chosen, *, x):
+                return chosen + x
+
+        self.assertTrue(T()([1, 2], x=2) == [3, 4])
+        with self.assertRaises(TypeError):
+            T()([1, 2])
+
+    def test_shared_keyword_only(self):
+        class T(DoAll):
+            def filter(self, chosen, *, low, high=10):
+                return low <= chosen < high
+
+            def action(self, chosen, *, low):
+                return chosen - low
+
+        self.assertTrue(T()([1, 2, 3, 11], low=2) == [0, 1])
+        self.assertTrue(T()([1, 2, 3, 11], low=2, high=3) == [0])
+
+    def test_required_keyword_only_with_default_elsewhere(self):
+        with self.assertRaises(ArgumentError):
+
+            class T(DoAll):
+                def filter(self, chosen, *, x):
+                    return chosen > x
+
+                def action(self, chosen, *, x=1):
+                    return chosen + x
+
+
+class TestCallMethodCache(unittest.TestCase):
+    def test_same_shape_shares_code(self):
+        class A(DoAll):
+            def action(self, chosen, offset=1):
+                return chosen + offset
+
+        class B(DoAll):
+            def action(self, chosen, offset=2):
+                return chosen + offset
+
+        self.assertIs(A.__call__.__code__, B.__call__.__code__)
+        self.assertTrue(A()([1, 2]) == [2, 3])
+        self.assertTrue(B()([1, 2]) == [3, 4])
+        self.assertTrue(A()([1, 2], 5) == [6, 7])
+
+    def test_different_shape_does_not_share_code(self):
+        class A(DoAll):
+            def action(self, chosen):
+                return chosen
+
+        class B(DoAll):
+            def action(self, chosen):
+                pass
+
+        self.assertIsNot(A.__call__.__code__, B.__call__.__code__)
+        self.assertTrue(A()([1, 2]) == [1, 2])
+        self.assertTrue(B()([1, 2]) is None)
+
+    def test_trivial_shape_shares_code(self):
+        class A(DoAll):
+            def action(self, chosen):
+                return chosen * 2
+
+        class B(DoAll):
+            @staticmethod
+            def action(chosen):
+                return chosen * 3
+
+        class C(DoAll):
+            def filter(self, chosen):
+                return chosen > 1
+
+        self.assertIs(A.__call__.__code__, B.__call__.__code__)
+        self.assertIsNot(A.__call__, B.__call__)
+        self.assertTrue(A()([1, 2]) == [2, 4])
+        self.assertTrue(B()([1, 2]) == [3, 6])
+        self.assertTrue(C()([1, 2, 3]) == [2, 3])
+        with self.assertRaises(TypeError):
+            A()([1, 2], 3)
+
+    def test_call_method_module(self):
+        class A(Do):
+            def action(self, value):
+                return value
+
+        class B(DoAll):
+            def sort_key(self, chosen):
+                return -chosen
+
+        class C(DoAll):
+            def action(self, chosen):
+                return chosen
+
+        for T in (A, B, C):
+            self.assertTrue(T.__call__.__module__ == __name__)
+            self.assertTrue(T.__call__.__qualname__ == B.__call__.__qualname__)
+
+    def test_defaulted_chosen_keeps_keyword(self):
+        class A(DoAll):
+            def action(self, chosen=5):
+                return chosen * 2
+
+        class B(DoAll):
+            def filter(self, chosen=5):
+                return chosen > 1
+
+        self.assertTrue(A()([1, 2]) == [2, 4])
+        self.assertTrue(A()([1, 2], chosen=3) == [2, 4])
+        self.assertTrue(B()([1, 2, 3], chosen=3) == [2, 3])
+
+    def test_reassigned_defaults_not_reused(self):
+        def act(self, chosen, k=1):
+            return chosen + k
+
+        class A(DoAll):
+            action = act
+
+        act.__defaults__ = (100,)
+
+        class B(DoAll):
+            action = act
+
+        self.assertTrue(B()([1]) == [101])
+
+
+class TestLazyDoAll(unittest.TestCase):
+    def test_lazy_action(self):
+        class T(DoAll):
+            lazy = True
+
+            def action(self, chosen, offset=1):
+                return chosen + offset
+
+        result = T()([1, 2])
+        self.assertNotIsInstance(result, list)
+        self.assertTrue(list(result) == [2, 3])
+
+    def test_lazy_filter_and_action(self):
+        calls = []
+
+        class T(DoAll):
+            lazy = True
+
+            def filter(self, chosen):
+                return chosen > 1
+
+            def action(self, chosen):
+                calls.append(chosen)
+                return chosen * 2
+
+        result = T()([1, 2, 3])
+        self.assertTrue(calls == [])
+        self.assertTrue(list(result) == [4, 6])
+        self.assertTrue(calls == [2, 3])
+
+    def test_lazy_filter(self):
+        class T(DoAll):
+            lazy = True
+
+            def filter(self, chosen):
+                return chosen > 1
+
+        result = T()([1, 2, 3])
+        self.assertNotIsInstance(result, list)
+        self.assertTrue(list(result) == [2, 3])
+
+    def test_lazy_post_controller_runs_after_actions(self):
+        calls = []
+
+        class T(DoAll):
+            lazy = True
+
+            def action(self, chosen):
+                calls.append(("action", chosen))
+                return chosen
+
+            def post_controller(self) -> None:
+                calls.append("post")
+
+        self.assertTrue(T()([1, 2]) == [1, 2])
+        self.assertTrue(calls == [("action", 1), ("action", 2), "post"])
+
+    def test_lazy_fold_receives_list(self):
+        class T(DoAll):
+            lazy = True
+
+            def action(self, chosen):
+                return chosen * 2
+
+            def fold(self, results):
+                return len(results)
+
+        self.assertTrue(T()([1, 2, 3]) == 3)
+
+
 if __name__ == "__main__":
     unittest.main()